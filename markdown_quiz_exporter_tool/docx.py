@@ -9,7 +9,7 @@ and has been reviewed and tested by a human.
 
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from docx import Document
 from docx.enum.style import WD_STYLE_TYPE
@@ -60,11 +60,11 @@ class DocxExporter:
             code_style.paragraph_format.space_before = Pt(6)
             code_style.paragraph_format.space_after = Pt(6)
 
-    def export(self, output_path: Path) -> int:
+    def export(self, output_path: Path | BinaryIO) -> int:
         """Export questions to DOCX format.
 
         Args:
-            output_path: Path where the DOCX file will be written
+            output_path: Path or binary stream where the DOCX file will be written
 
         Returns:
             Number of questions exported
@@ -79,7 +79,7 @@ class DocxExporter:
             if i < len(self.questions) - 1:
                 self._add_horizontal_line()
 
-        self.document.save(str(output_path))
+        self.document.save(str(output_path) if isinstance(output_path, Path) else output_path)
         return len(self.questions)
 
     def _add_question(self, question: Question, number: int) -> None:
@@ -299,12 +299,12 @@ class DocxExporter:
         p_pr.append(p_bdr)
 
 
-def export_to_docx(questions: list[Question], output_path: Path) -> int:
+def export_to_docx(questions: list[Question], output_path: Path | BinaryIO) -> int:
     """Export questions to Word DOCX format.
 
     Args:
         questions: List of Question objects to export
-        output_path: Path where the DOCX file will be written
+        output_path: Path or binary stream where the DOCX file will be written
 
     Returns:
         Number of questions exported
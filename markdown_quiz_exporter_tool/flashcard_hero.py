@@ -12,6 +12,12 @@ from pathlib import Path
 
 from markdown_quiz_exporter_tool.quiz_parser import Question
 
+# Markdown formatting stripped from flashcard text, compiled once per process
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.+?)\*")
+_CODE_RE = re.compile(r"`(.+?)`")
+_LINK_RE = re.compile(r"\[(.+?)\]\(.+?\)")
+
 
 class FlashcardHeroExporter:
     """Exporter for Flashcard Hero TSV format."""
@@ -129,16 +135,16 @@ class FlashcardHeroExporter:
             Plain text without markdown
         """
         # Remove bold **text**
-        text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
+        text = _BOLD_RE.sub(r"\1", text)
 
         # Remove italic *text*
-        text = re.sub(r"\*(.+?)\*", r"\1", text)
+        text = _ITALIC_RE.sub(r"\1", text)
 
         # Remove code `text`
-        text = re.sub(r"`(.+?)`", r"\1", text)
+        text = _CODE_RE.sub(r"\1", text)
 
         # Remove markdown links [text](url)
-        text = re.sub(r"\[(.+?)\]\(.+?\)", r"\1", text)
+        text = _LINK_RE.sub(r"\1", text)
 
         return text
 
@@ -9,10 +9,33 @@ and has been reviewed and tested by a human.
 
 import html
 import json
+import re
 from pathlib import Path
 
 from markdown_quiz_exporter_tool.quiz_parser import Question
 
+# Indentation and blank lines in the embedded templates
+_LINE_PADDING_RE = re.compile(r"^[ \t]+|[ \t]+$|\n(?=[ \t]*$)", re.M)
+
+
+def _compact_whitespace(source: str) -> str:
+    """Strip indentation and blank lines from embedded JS or CSS.
+
+    Line breaks are kept, so statement boundaries and HTML whitespace
+    collapsing inside the JS template literals are unaffected.
+
+    Args:
+        source: Script or style source
+
+    Returns:
+        Source without leading/trailing line whitespace and empty lines
+    """
+    return _LINE_PADDING_RE.sub("", source).strip()
+
+
+# Language tag of a fenced code block: ```python or ~~~ js
+_FENCE_LANG_RE = re.compile(r"^[ \t]*(?:```|~~~)[ \t]*([\w+#.-]+)", re.M)
+
 
 class QuizHTMLGenerator:
     """Generator for interactive HTML quiz pages."""
@@ -39,12 +62,12 @@ class QuizHTMLGenerator:
         Raises:
             OSError: If writing to file fails
         """
-        html_content = self._build_html()
-        output_path.write_text(html_content, encoding="utf-8")
-        return len(html_content.encode("utf-8"))
+        data = self.render().encode("utf-8")
+        output_path.write_bytes(data)
+        return len(data)
 
-    def _build_html(self) -> str:
-        """Build complete HTML document.
+    def render(self) -> str:
+        """Build complete HTML document without writing it.
 
         Returns:
             Complete HTML document as string
@@ -74,15 +97,11 @@ class QuizHTMLGenerator:
         }};
     </script>
     <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://cdn.jsdelivr.net/npm/marked@11.1.1/marked.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/gh/highlightjs/cdn-release@11.9.0/build/highlight.min.js"></script>
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/gh/highlightjs/cdn-release@11.9.0/build/styles/github-dark.min.css" media="(prefers-color-scheme: dark)">
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/gh/highlightjs/cdn-release@11.9.0/build/styles/github.min.css" media="(prefers-color-scheme: light)">
     <!-- KaTeX for LaTeX math rendering -->
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.22/dist/katex.min.css">
-    <script src="https://cdn.jsdelivr.net/npm/katex@0.16.22/dist/katex.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/katex@0.16.22/dist/contrib/auto-render.min.js"></script>
-    {self._build_styles()}
+    {_compact_whitespace(self._build_styles())}
 </head>"""
 
     def _build_styles(self) -> str:
@@ -239,13 +258,11 @@ class QuizHTMLGenerator:
     <div id="app" class="container mx-auto px-4 py-8 max-w-4xl"></div>
 
     <!-- Quiz data -->
-    <script>
-        const QUIZ_DATA = {self._build_quiz_data()};
-    </script>
+    <script id="quiz-data" type="application/json">{self._build_quiz_data_block()}</script>
 
     <!-- Quiz application -->
     <script>
-        {self._build_javascript()}
+{_compact_whitespace(self._build_javascript())}
     </script>
 </body>"""
 
@@ -258,9 +275,31 @@ class QuizHTMLGenerator:
         quiz_data = {
             "title": self.title,
             "questions": [self._question_to_dict(q) for q in self.questions],
+            "languages": self._collect_code_languages(),
         }
         return json.dumps(quiz_data, ensure_ascii=False, separators=(",", ":"))
 
+    def _build_quiz_data_block(self) -> str:
+        """Convert questions to JSON safe for embedding in a script element.
+
+        Returns:
+            JSON string that cannot close or comment out its script element
+        """
+        return self._build_quiz_data().replace("</", "<\\/").replace("<!--", "\\u003c!--")
+
+    def _collect_code_languages(self) -> list[str]:
+        """Collect the languages tagged on fenced code blocks in the quiz.
+
+        Returns:
+            Sorted list of lowercased language names
+        """
+        languages: set[str] = set()
+        for question in self.questions:
+            texts = [question.text, question.reason, *(ans.text for ans in question.answers)]
+            for text in texts:
+                languages.update(lang.lower() for lang in _FENCE_LANG_RE.findall(text))
+        return sorted(languages)
+
     def _question_to_dict(self, question: Question) -> dict[str, object]:
         """Convert Question object to dictionary.
 
@@ -271,8 +310,7 @@ class QuizHTMLGenerator:
             Dictionary representation of question
         """
         # Extract category from question text if present
-        category = self._extract_category(question.text)
-        clean_text = self._clean_question_text(question.text)
+        category, clean_text = self._split_category(question.text)
 
         return {
             "category": category,
@@ -282,37 +320,21 @@ class QuizHTMLGenerator:
             "reason": question.reason,
         }
 
-    def _extract_category(self, text: str) -> str:
-        """Extract category tag from question text.
+    def _split_category(self, text: str) -> tuple[str, str]:
+        """Split an optional category prefix from question text.
 
         Args:
             text: Question text that may contain category prefix
 
         Returns:
-            Category name or empty string
+            Tuple of (category name or empty string, clean question text)
         """
-        # Look for pattern: "CATEGORY: Question text"
-        if ":" in text:
-            parts = text.split(":", 1)
-            potential_category = parts[0].strip()
-            # Check if it's all caps and short (likely a category)
-            if potential_category.isupper() and len(potential_category) < 30:
-                return potential_category
-        return ""
-
-    def _clean_question_text(self, text: str) -> str:
-        """Remove category prefix from question text.
-
-        Args:
-            text: Question text that may contain category prefix
-
-        Returns:
-            Clean question text
-        """
-        category = self._extract_category(text)
-        if category:
-            return text.split(":", 1)[1].strip()
-        return text
+        # Look for pattern: "CATEGORY: Question text", all caps and short
+        head, sep, rest = text.partition(":")
+        head = head.strip()
+        if sep and head.isupper() and len(head) < 30:
+            return head, rest.strip()
+        return "", text
 
     def _build_javascript(self) -> str:
         """Build embedded JavaScript application.
@@ -323,10 +345,72 @@ class QuizHTMLGenerator:
         # ruff: noqa: E501
         # Long lines in HTML/JS templates are acceptable for readability
         return """
+// Quiz data is embedded as a JSON block; JSON.parse is faster than parsing a JS literal
+const QUIZ_DATA = JSON.parse(document.getElementById('quiz-data').textContent);
+
+// Languages tagged on code blocks in this quiz; candidates for untagged blocks
+const USED_LANGS = QUIZ_DATA.languages || [];
+
+// Border/background classes and icons per answer state
+const ANSWER_STYLES = {
+    neutral: 'border-gray-200 dark:border-gray-700 bg-white dark:bg-gray-800',
+    selected: 'border-blue-500 bg-blue-50 dark:bg-blue-900/20',
+    correct: 'border-green-500 bg-green-50 dark:bg-green-900/20',
+    incorrect: 'border-red-500 bg-red-50 dark:bg-red-900/20'
+};
+const ANSWER_STYLE_CLASSES = Object.values(ANSWER_STYLES).join(' ').split(' ');
+// Answer input per question type
+const QUESTION_SHAPES = {
+    single: { isMultiple: false, inputType: 'radio' },
+    multiple: { isMultiple: true, inputType: 'checkbox' }
+};
+const QUESTION_TEXT_CLASS = 'text-gray-900 dark:text-gray-100 mb-6 prose prose-lg dark:prose-invert max-w-none';
+const ANSWER_ICONS = {
+    correct: '<span class="text-green-600 font-bold">✓</span>',
+    incorrect: '<span class="text-red-600 font-bold">✗</span>'
+};
+
+// Score status styling by band: >= 75% passed, >= 50% sufficient, otherwise insufficient
+const SCORE_STATUS = {
+    passed: {ring: 'text-green-500', text: 'text-green-600', label: 'Geslaagd ✓'},
+    sufficient: {ring: 'text-yellow-500', text: 'text-yellow-600', label: 'Voldoende'},
+    insufficient: {ring: 'text-red-500', text: 'text-red-600', label: 'Onvoldoende'}
+};
+
+// Circumference of the r=45 score ring, used for its stroke-dasharray
+const SCORE_RING_CIRCUMFERENCE = 2 * Math.PI * 45;
+
+// Question page buttons
+const BTN_CHECK = '<button id="check-answer" class="px-6 py-2 bg-green-600 hover:bg-green-700 text-white font-semibold rounded-lg shadow">Controleren</button>';
+const BTN_CHECKED = '<button class="px-6 py-2 bg-gray-300 dark:bg-gray-600 text-gray-500 dark:text-gray-400 rounded-lg cursor-not-allowed" disabled>Gecontroleerd ✓</button>';
+const BTN_SUBMIT = '<button id="submit-quiz" class="px-6 py-2 bg-blue-600 hover:bg-blue-700 text-white font-semibold rounded-lg shadow">Afronden →</button>';
+const BTN_NEXT = '<button id="next-question" class="px-6 py-2 bg-blue-600 hover:bg-blue-700 text-white font-semibold rounded-lg shadow">Volgende →</button>';
+const BTN_PREV = '<button id="prev-question" class="px-6 py-2 bg-gray-200 dark:bg-gray-700 text-gray-700 dark:text-gray-300 font-semibold rounded-lg shadow hover:bg-gray-300 dark:hover:bg-gray-600">← Vorige</button>';
+
+// HTML escaping without creating DOM nodes
+const ESC_RE = /[&<>"']/g;
+const ESC_MAP = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+
+// Markdown, highlighting and LaTeX libraries, loaded when the first question is shown
+const ASSET_SCRIPTS = [
+    'https://cdn.jsdelivr.net/npm/marked@11.1.1/marked.min.js',
+    'https://cdn.jsdelivr.net/gh/highlightjs/cdn-release@11.9.0/build/highlight.min.js',
+    'https://cdn.jsdelivr.net/npm/katex@0.16.22/dist/katex.min.js',
+    'https://cdn.jsdelivr.net/npm/katex@0.16.22/dist/contrib/auto-render.min.js'
+];
+
 // Quiz Application
 class QuizApp {
     constructor(quizData) {
         this.quizData = quizData;
+        this._mdCache = new Map();  // Rendered markdown keyed by source text
+        this._saveScheduled = false;
+        this._assetsPromise = null;
+        this._assetsLoaded = false;
+        this._starting = false;  // Set while startQuiz waits for the CDN assets
+        this._correctness = null;  // Per-question result, computed once per set of answers
+        this._score = null;
+        this._reviewAnswersHtml = [];  // Review page answer markup per question index
         this.state = this.loadState() || this.initializeState();
         this.init();
     }
@@ -338,6 +422,9 @@ class QuizApp {
             document.documentElement.classList.add('dark');
         }
 
+        // Write any pending state before the page goes away
+        window.addEventListener('pagehide', () => this.flushState());
+
         // Render initial page
         this.render();
     }
@@ -378,53 +465,138 @@ class QuizApp {
 
     // Prepare questions (with shuffling if configured)
     prepareQuestions() {
-        let questions = [...this.quizData.questions];
+        // Annotate the parsed quiz data in place. Answer arrays of QUIZ_DATA are never
+        // reordered, so repeating this on restart/restore yields the same indices.
+        const questions = this.quizData.questions;
+        for (let i = 0; i < questions.length; i++) {
+            const answers = questions[i].answers;
+            const text = questions[i].text;
+            questions[i].originalIndex = i;
+            questions[i]._shortText = text.length > 60 ? text.substring(0, 60) + '...' : text;
+            for (let j = 0; j < answers.length; j++) {
+                answers[j].originalIndex = j;
+            }
+            questions[i].correctMask = this.getCorrectMask(answers);
+        }
 
         // Note: Shuffling will be applied when starting quiz from intro
-        return questions.map((q, index) => ({
-            ...q,
-            originalIndex: index,
-            answers: q.answers.map((a, i) => ({ ...a, originalIndex: i }))
-        }));
+        return questions.slice();
+    }
+
+    // Bitmask of correct answer positions (bit i set when answers[i] is correct).
+    // Shifts wrap at 32 bits, so longer answer lists get null and are compared by index.
+    getCorrectMask(answers) {
+        if (answers.length > 31) return null;
+        return answers.reduce((mask, a, i) => a.correct ? (mask | (1 << i)) : mask, 0);
     }
 
     // Apply shuffling based on config
     applyShuffling() {
         if (this.state.config.shuffleQuestions) {
-            this.state.questions = this.shuffleArray(this.state.questions);
+            // state.questions is our own copy of the list, shuffle it in place
+            this.shuffleArray(this.state.questions);
         }
 
         if (this.state.config.shuffleAnswers) {
-            this.state.questions = this.state.questions.map(q => ({
-                ...q,
-                answers: this.shuffleArray([...q.answers])
-            }));
+            // Answer arrays are shared with QUIZ_DATA, shuffle a copy
+            this.state.questions = this.state.questions.map(q => {
+                const answers = this.shuffleArray(q.answers.slice());
+                return { ...q, answers, correctMask: this.getCorrectMask(answers) };
+            });
         }
     }
 
-    // Shuffle array (Fisher-Yates algorithm)
+    // Shuffle array in place (Fisher-Yates algorithm)
     shuffleArray(array) {
-        const shuffled = [...array];
-        for (let i = shuffled.length - 1; i > 0; i--) {
+        for (let i = array.length - 1; i > 0; i--) {
             const j = Math.floor(Math.random() * (i + 1));
-            [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
+            const tmp = array[i];
+            array[i] = array[j];
+            array[j] = tmp;
         }
-        return shuffled;
+        return array;
     }
 
     // State management
     saveState() {
+        // Debounced: bursts of mutations result in a single write when idle
+        if (this._saveScheduled) return;
+        this._saveScheduled = true;
+        if (window.requestIdleCallback) {
+            window.requestIdleCallback(() => this.flushState(), { timeout: 250 });
+        } else {
+            setTimeout(() => this.flushState(), 250);
+        }
+    }
+
+    flushState() {
+        if (!this._saveScheduled) return;
+        this._saveScheduled = false;
         try {
-            sessionStorage.setItem('quizState', JSON.stringify(this.state));
+            sessionStorage.setItem('quizState', JSON.stringify(this._pickPersisted()));
         } catch (e) {
             console.error('Failed to save state:', e);
         }
     }
 
+    // Mutable part of the state; question content is restored from QUIZ_DATA
+    _pickPersisted() {
+        const { questions, timerInterval, ...persisted } = this.state;
+        persisted.order = questions.map(q => [q.originalIndex, q.answers.map(a => a.originalIndex)]);
+        if (questions.every(q => q.answers.length <= 7)) {
+            delete persisted.answers;
+            delete persisted.checked;
+            persisted.packed = this._packState();
+        }
+        return persisted;
+    }
+
+    // Pack answers/checked into one byte per question (checked << 7 | selected mask), base64 encoded
+    _packState() {
+        const bytes = new Uint8Array(this.state.questions.length);
+        for (let i = 0; i < bytes.length; i++) {
+            const selected = this.state.answers[i] || [];
+            let mask = 0;
+            for (const answerIndex of selected) mask |= 1 << answerIndex;
+            bytes[i] = (this.state.checked[i] ? 0x80 : 0) | (mask & 0x7F);
+        }
+        let binary = '';
+        for (let i = 0; i < bytes.length; i++) binary += String.fromCharCode(bytes[i]);
+        return btoa(binary);
+    }
+
+    _unpackState(packed) {
+        const binary = atob(packed);
+        const answers = {};
+        const checked = {};
+        for (let i = 0; i < binary.length; i++) {
+            const byte = binary.charCodeAt(i);
+            const selected = [];
+            for (let bit = 0; bit < 7; bit++) {
+                if (byte & (1 << bit)) selected.push(bit);
+            }
+            if (selected.length > 0) answers[i] = selected;
+            if (byte & 0x80) checked[i] = true;
+        }
+        return { answers, checked };
+    }
+
     loadState() {
         try {
             const saved = sessionStorage.getItem('quizState');
-            return saved ? JSON.parse(saved) : null;
+            if (!saved) return null;
+
+            const { order, packed, ...state } = JSON.parse(saved);
+            if (packed !== undefined) {
+                Object.assign(state, this._unpackState(packed));
+            }
+            const questions = this.prepareQuestions();
+            state.questions = order.map(([questionIndex, answerOrder]) => {
+                const answers = answerOrder.map(answerIndex => questions[questionIndex].answers[answerIndex]);
+                return { ...questions[questionIndex], answers, correctMask: this.getCorrectMask(answers) };
+            });
+            state.timerInterval = null;
+            return state;
         } catch (e) {
             console.error('Failed to load state:', e);
             return null;
@@ -447,16 +619,43 @@ class QuizApp {
     }
 
     goToQuestion(index) {
+        const onQuestionPage = this.state.currentPage === 'question';
         this.state.currentPage = 'question';
         this.state.currentQuestionIndex = index;
         this.saveState();
-        this.render();
+
+        // Between questions the page scaffold stays; only the card, nav and progress change
+        if (onQuestionPage && document.getElementById('question-card')) {
+            this.patchQuestion(index);
+        } else {
+            this.render();
+        }
+    }
+
+    patchQuestion(index) {
+        const body = document.getElementById('question-body');
+        body.innerHTML = this.renderQuestionBody(index);
+        document.getElementById('question-nav').innerHTML = this.renderQuestionNav(index);
+        document.getElementById('progress-fill').style.width = this.getProgress(index) + '%';
+        this.updateQuestionLabels(index);
+        this.renderLatex(body);
+    }
+
+    // Plain-text parts of the question page, written as text instead of parsed markup
+    updateQuestionLabels(index) {
+        const category = this.state.questions[index].category;
+        const badge = document.getElementById('question-category');
+        badge.textContent = category;
+        badge.classList.toggle('hidden', !category);
+        document.getElementById('question-counter').textContent =
+            'Vraag ' + (index + 1) + ' / ' + this.state.questions.length;
     }
 
     goToStatistics() {
         this.state.currentPage = 'statistics';
         this.state.endTime = Date.now();
         this.stopTimer();
+        this.getCorrectness();
         this.saveState();
         this.render();
     }
@@ -487,14 +686,63 @@ class QuizApp {
         }
     }
 
+    // Load the rendering libraries once; later calls return the cached promise
+    _ensureAssets() {
+        if (!this._assetsPromise) {
+            this._assetsPromise = Promise.all(ASSET_SCRIPTS.map(src => this._loadScript(src)))
+                .catch(e => console.error('Failed to load assets:', e))
+                .then(() => {
+                    this._assetsLoaded = true;
+                    configureMarked();
+                    this.prerenderMarkdown();
+                });
+        }
+        return this._assetsPromise;
+    }
+
+    _loadScript(src) {
+        return new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = src;
+            script.async = false;  // Download in parallel, execute in order (auto-render needs katex)
+            script.onload = resolve;
+            script.onerror = () => reject(new Error('Failed to load ' + src));
+            document.head.appendChild(script);
+        });
+    }
+
+    // Render all quiz markdown once so render methods read the stored HTML directly
+    prerenderMarkdown() {
+        // Restored state holds copies of the QUIZ_DATA question objects, annotate both
+        for (const questions of [this.quizData.questions, this.state.questions]) {
+            for (const question of questions) {
+                if (question._renderedText !== undefined) continue;
+                question._renderedText = this.renderMarkdown(question.text);
+                question._renderedReason = this.renderMarkdown(question.reason);
+                for (const answer of question.answers) {
+                    answer._renderedText = this.renderMarkdown(answer.text);
+                }
+            }
+        }
+    }
+
     // Quiz logic
-    startQuiz() {
+    async startQuiz() {
+        // Ignore further start clicks while the first one waits for assets
+        if (this._starting) return;
+        this._starting = true;
+        try {
+            await this._ensureAssets();
+        } finally {
+            this._starting = false;
+        }
         this.applyShuffling();
         this.state.startTime = Date.now();
         this.state.currentPage = 'question';
         this.state.currentQuestionIndex = 0;
         this.state.answers = {};
         this.state.checked = {};
+        this.invalidateScore();
 
         // Initialize timer if enabled
         if (this.state.config.timerEnabled) {
@@ -526,24 +774,40 @@ class QuizApp {
     }
 
     updateTimerDisplay() {
-        // Update only the timer display without re-rendering the entire page
+        // Update only the timer display without re-rendering the entire page,
+        // and only write to the DOM when the shown text or color actually changes
         const timerDisplay = document.getElementById('timer-display');
         if (timerDisplay) {
-            timerDisplay.textContent = '⏱️ ' + (this.state.timerPaused ? 'GEPAUZEERD' : this.formatTimerDisplay(this.state.timerSeconds));
-            timerDisplay.className = 'text-lg font-mono font-bold ' + this.getTimerColorClass();
+            const text = '⏱️ ' + (this.state.timerPaused ? 'GEPAUZEERD' : this.formatTimerDisplay(this.state.timerSeconds));
+            if (timerDisplay.textContent !== text) {
+                timerDisplay.textContent = text;
+            }
+            const className = 'text-lg font-mono font-bold ' + this.getTimerColorClass();
+            if (timerDisplay.className !== className) {
+                timerDisplay.className = className;
+            }
+        }
+    }
+
+    updateTimerToggle() {
+        const timerToggle = document.getElementById('timer-toggle');
+        if (timerToggle) {
+            timerToggle.textContent = this.state.timerPaused ? '▶️ Hervatten' : '⏸️ Pauzeren';
         }
     }
 
     pauseTimer() {
         this.state.timerPaused = true;
         this.saveState();
-        this.render();
+        this.updateTimerDisplay();
+        this.updateTimerToggle();
     }
 
     resumeTimer() {
         this.state.timerPaused = false;
         this.saveState();
-        this.render();
+        this.updateTimerDisplay();
+        this.updateTimerToggle();
     }
 
     stopTimer() {
@@ -627,8 +891,9 @@ class QuizApp {
             this.state.answers[questionIndex] = [answerIndex];
         }
 
+        this.invalidateScore();
         this.saveState();
-        this.render();
+        this.patchAnswers(questionIndex);
     }
 
     checkAnswer(questionIndex) {
@@ -640,40 +905,103 @@ class QuizApp {
         }
 
         this.state.checked[questionIndex] = true;
+        this.invalidateScore();
         this.saveState();
-        this.render();
+
+        // Patch the rendered question in place instead of re-rendering the page
+        this.patchAnswers(questionIndex);
+        const checkButton = document.getElementById('check-answer');
+        if (checkButton) {
+            checkButton.outerHTML = BTN_CHECKED;
+        }
+        const body = document.getElementById('question-body');
+        if (body) {
+            body.insertAdjacentHTML('beforeend', this.renderReason(this.state.questions[questionIndex]));
+            this.renderLatex(body.lastElementChild);
+        }
     }
 
-    isAnswerCorrect(questionIndex) {
+    // Determine display state of an answer option
+    getAnswerState(answer, isSelected, isChecked) {
+        if (isChecked) {
+            if (answer.correct) return 'correct';
+            if (isSelected) return 'incorrect';
+            return 'neutral';
+        }
+        return isSelected ? 'selected' : 'neutral';
+    }
+
+    // Update classes, inputs and icons of the rendered answer nodes
+    patchAnswers(questionIndex) {
         const question = this.state.questions[questionIndex];
+        const isChecked = !!this.state.checked[questionIndex];
         const selectedIndices = this.state.answers[questionIndex] || [];
-        const correctIndices = question.answers
-            .map((a, i) => a.correct ? i : -1)
-            .filter(i => i !== -1);
 
-        if (selectedIndices.length !== correctIndices.length) {
-            return false;
+        document.querySelectorAll('[data-answer-index]').forEach(div => {
+            const answerIndex = +div.dataset.answerIndex;
+            const isSelected = selectedIndices.includes(answerIndex);
+            const answerState = this.getAnswerState(question.answers[answerIndex], isSelected, isChecked);
+
+            div.classList.remove(...ANSWER_STYLE_CLASSES);
+            div.classList.add(...ANSWER_STYLES[answerState].split(' '));
+
+            const input = div.querySelector('input');
+            input.checked = isSelected;
+            input.disabled = isChecked;
+
+            if (ANSWER_ICONS[answerState] && !div.querySelector('[data-answer-icon]')) {
+                div.querySelector('label').insertAdjacentHTML('beforeend', this.renderAnswerIcon(answerState));
+            }
+        });
+    }
+
+    renderAnswerIcon(answerState) {
+        return ANSWER_ICONS[answerState].replace('<span', '<span data-answer-icon');
+    }
+
+    isAnswerCorrect(questionIndex) {
+        const question = this.state.questions[questionIndex];
+        const selectedIndices = this.state.answers[questionIndex] || [];
+        if (question.correctMask === null) {
+            const selected = new Set(selectedIndices);
+            return question.answers.every((answer, i) => answer.correct === selected.has(i));
         }
+        const selectedMask = selectedIndices.reduce((mask, i) => mask | (1 << i), 0);
 
-        const sortedSelected = [...selectedIndices].sort();
-        const sortedCorrect = [...correctIndices].sort();
+        return selectedMask === question.correctMask;
+    }
 
-        return sortedSelected.every((val, idx) => val === sortedCorrect[idx]);
+    // Results are cached until an answer is selected or checked again
+    getCorrectness() {
+        if (!this._correctness) {
+            this._correctness = this.state.questions.map((_, i) => this.isAnswerCorrect(i));
+        }
+        return this._correctness;
+    }
+
+    invalidateScore() {
+        this._correctness = null;
+        this._score = null;
+        this._reviewAnswersHtml = [];
     }
 
     calculateScore() {
+        if (this._score) return this._score;
+
+        const correctness = this.getCorrectness();
         const total = this.state.questions.length;
         const answered = Object.keys(this.state.checked).length;
         const correct = Object.keys(this.state.checked)
-            .filter(i => this.isAnswerCorrect(parseInt(i)))
+            .filter(i => correctness[i])
             .length;
 
-        return {
+        this._score = {
             total,
             answered,
             correct,
             percentage: total > 0 ? Math.round((correct / total) * 100) : 0
         };
+        return this._score;
     }
 
     getElapsedTime() {
@@ -692,20 +1020,29 @@ class QuizApp {
     restartQuiz() {
         this.clearState();
         this.state = this.initializeState();
+        this.invalidateScore();
         this.saveState();
         this.render();
     }
 
     // Master render function
     render() {
+        // Pages other than the intro need the markdown/LaTeX libraries
+        if (this.state.currentPage !== 'intro' && !this._assetsLoaded) {
+            this._ensureAssets().then(() => this.render());
+            return;
+        }
+
         const app = document.getElementById('app');
 
         if (this.state.currentPage === 'intro') {
             app.innerHTML = this.renderIntro();
         } else if (this.state.currentPage === 'question') {
             app.innerHTML = this.renderQuestion(this.state.currentQuestionIndex);
+            this.updateQuestionLabels(this.state.currentQuestionIndex);
         } else if (this.state.currentPage === 'statistics') {
             app.innerHTML = this.renderStatistics();
+            this.appendQuestionsReview(document.getElementById('questions-review'));
         } else if (this.state.currentPage === 'review') {
             app.innerHTML = this.renderReview(this.state.currentQuestionIndex);
         }
@@ -813,81 +1150,7 @@ class QuizApp {
 
     // Render question page - CONTINUING IN NEXT PART...
     renderQuestion(index) {
-        const question = this.state.questions[index];
-        const isChecked = this.state.checked[index];
-        const selectedIndices = this.state.answers[index] || [];
-        const progress = ((index + 1) / this.state.questions.length) * 100;
-        const isMultiple = question.type === 'multiple';
-
-        let answersHtml = '';
-        question.answers.forEach((answer, answerIndex) => {
-            const isSelected = selectedIndices.includes(answerIndex);
-            const isCorrect = answer.correct;
-
-            let borderClass = 'border-gray-200 dark:border-gray-700';
-            let bgClass = 'bg-white dark:bg-gray-800';
-            let icon = '';
-
-            if (isChecked) {
-                if (isCorrect) {
-                    borderClass = 'border-green-500';
-                    bgClass = 'bg-green-50 dark:bg-green-900/20';
-                    icon = '<span class="text-green-600 font-bold">✓</span>';
-                } else if (isSelected) {
-                    borderClass = 'border-red-500';
-                    bgClass = 'bg-red-50 dark:bg-red-900/20';
-                    icon = '<span class="text-red-600 font-bold">✗</span>';
-                }
-            } else if (isSelected) {
-                borderClass = 'border-blue-500';
-                bgClass = 'bg-blue-50 dark:bg-blue-900/20';
-            }
-
-            const inputType = isMultiple ? 'checkbox' : 'radio';
-            const inputName = isMultiple ? '' : 'answer-' + index;
-
-            answersHtml += `
-                <div class="border-2 ${borderClass} ${bgClass} rounded-lg p-4 cursor-pointer hover:border-blue-400 transition-colors"
-                     data-answer-index="${answerIndex}">
-                    <label class="flex items-start cursor-pointer">
-                        <input type="${inputType}"
-                               ${inputName ? 'name="' + inputName + '"' : ''}
-                               ${isSelected ? 'checked' : ''}
-                               ${isChecked ? 'disabled' : ''}
-                               class="w-5 h-5 text-blue-600 mr-3 mt-1 flex-shrink-0">
-                        <div class="flex-1 text-gray-900 dark:text-gray-100 prose prose-sm dark:prose-invert max-w-none">
-                            ${this.renderMarkdown(answer.text)}
-                        </div>
-                        ${icon}
-                    </label>
-                </div>
-            `;
-        });
-
-        const reasonHtml = isChecked ? `
-            <div class="mt-6 p-4 bg-blue-50 dark:bg-blue-900/20 border-l-4 border-blue-500 rounded">
-                <div class="flex items-center mb-2">
-                    <span class="text-2xl mr-2">💡</span>
-                    <span class="font-semibold text-blue-900 dark:text-blue-100">Uitleg</span>
-                </div>
-                <div class="text-gray-700 dark:text-gray-300 prose prose-sm dark:prose-invert max-w-none">
-                    ${this.renderMarkdown(question.reason)}
-                </div>
-            </div>
-        ` : '';
-
-        const checkButton = isChecked
-            ? '<button class="px-6 py-2 bg-gray-300 dark:bg-gray-600 text-gray-500 dark:text-gray-400 rounded-lg cursor-not-allowed" disabled>Gecontroleerd ✓</button>'
-            : '<button id="check-answer" class="px-6 py-2 bg-green-600 hover:bg-green-700 text-white font-semibold rounded-lg shadow">Controleren</button>';
-
-        const isLastQuestion = index === this.state.questions.length - 1;
-        const nextButton = isLastQuestion
-            ? '<button id="submit-quiz" class="px-6 py-2 bg-blue-600 hover:bg-blue-700 text-white font-semibold rounded-lg shadow">Afronden →</button>'
-            : '<button id="next-question" class="px-6 py-2 bg-blue-600 hover:bg-blue-700 text-white font-semibold rounded-lg shadow">Volgende →</button>';
-
-        const backButton = index > 0
-            ? '<button id="prev-question" class="px-6 py-2 bg-gray-200 dark:bg-gray-700 text-gray-700 dark:text-gray-300 font-semibold rounded-lg shadow hover:bg-gray-300 dark:hover:bg-gray-600">← Vorige</button>'
-            : '';
+        const progress = this.getProgress(index);
 
         // Timer display (if enabled)
         const timerHtml = this.state.config.timerEnabled ? `
@@ -910,46 +1173,111 @@ class QuizApp {
                     <div class="flex justify-between items-center mb-2">
                         <span class="text-sm text-gray-600 dark:text-gray-400">Voortgang</span>
                         <div class="flex items-center gap-2">
-                            ` + timerHtml + `
-                            <span class="text-sm font-semibold text-gray-900 dark:text-gray-100">
-                                Vraag ` + (index + 1) + ` / ` + this.state.questions.length + `
-                            </span>
+                            ${timerHtml}
+                            <span id="question-counter" class="text-sm font-semibold text-gray-900 dark:text-gray-100"></span>
                         </div>
                     </div>
                     <div class="w-full bg-gray-200 dark:bg-gray-700 rounded-full h-2">
-                        <div class="progress-bar bg-blue-600 h-2 rounded-full"
-                             style="width: ` + progress + `%"></div>
+                        <div id="progress-fill" class="progress-bar bg-blue-600 h-2 rounded-full"
+                             style="width: ${progress}%"></div>
                     </div>
                 </div>
 
                 <!-- Question card -->
-                <div class="bg-white dark:bg-gray-800 rounded-lg shadow-lg p-8">
-                    ${question.category ? `
-                        <div class="inline-block px-3 py-1 bg-gray-200 dark:bg-gray-700 text-gray-700 dark:text-gray-300 text-sm font-semibold rounded mb-4">
-                            ${this.escapeHtml(question.category)}
-                        </div>
-                    ` : ''}
-
-                    <div class="text-gray-900 dark:text-gray-100 mb-6 prose prose-lg dark:prose-invert max-w-none ${this.state.config.boldQuestions ? 'bold-questions' : ''}">
-                        ${this.renderMarkdown(question.text)}
+                <div id="question-card" class="bg-white dark:bg-gray-800 rounded-lg shadow-lg p-8">
+                    <div id="question-category" class="inline-block px-3 py-1 bg-gray-200 dark:bg-gray-700 text-gray-700 dark:text-gray-300 text-sm font-semibold rounded mb-4"></div>
+                    <div id="question-body">
+                        ${this.renderQuestionBody(index)}
                     </div>
+                </div>
 
-                    <div class="space-y-3 mb-6" id="answers-container">
-                        ${answersHtml}
-                    </div>
+                <!-- Navigation -->
+                <div id="question-nav" class="flex justify-between items-center mt-6">
+                    ${this.renderQuestionNav(index)}
+                </div>
+            </div>
+        `;
+    }
+
+    getProgress(index) {
+        return ((index + 1) / this.state.questions.length) * 100;
+    }
+
+    // Inner markup of #question-body: question text, answers and reason
+    renderQuestionBody(index) {
+        const question = this.state.questions[index];
+        const isChecked = this.state.checked[index];
+        const selectedIndices = this.state.answers[index] || [];
+        const shape = QUESTION_SHAPES[question.type === 'multiple' ? 'multiple' : 'single'];
+        const textClass = QUESTION_TEXT_CLASS + (this.state.config.boldQuestions ? ' bold-questions' : '');
+        const inputName = shape.isMultiple ? '' : 'name="answer-' + index + '"';
 
-                    ${reasonHtml}
+        const answersHtml = question.answers.map((answer, answerIndex) => {
+            const isSelected = selectedIndices.includes(answerIndex);
+            const answerState = this.getAnswerState(answer, isSelected, isChecked);
+            const icon = ANSWER_ICONS[answerState] ? this.renderAnswerIcon(answerState) : '';
+
+            return `
+                <div class="border-2 ${ANSWER_STYLES[answerState]} rounded-lg p-4 cursor-pointer hover:border-blue-400 transition-colors"
+                     data-answer-index="${answerIndex}">
+                    <label class="flex items-start cursor-pointer">
+                        <input type="${shape.inputType}"
+                               ${inputName}
+                               ${isSelected ? 'checked' : ''}
+                               ${isChecked ? 'disabled' : ''}
+                               class="w-5 h-5 text-blue-600 mr-3 mt-1 flex-shrink-0">
+                        <div class="flex-1 text-gray-900 dark:text-gray-100 prose prose-sm dark:prose-invert max-w-none">
+                            ${answer._renderedText ?? this.renderMarkdown(answer.text)}
+                        </div>
+                        ${icon}
+                    </label>
                 </div>
+            `;
+        }).join('');
 
-                <!-- Navigation -->
-                <div class="flex justify-between items-center mt-6">
-                    <div>
-                        ${backButton}
-                    </div>
-                    <div class="flex gap-3">
-                        ${checkButton}
-                        ${nextButton}
-                    </div>
+        const reasonHtml = isChecked ? this.renderReason(question) : '';
+
+        return `
+            <div class="${textClass}">
+                ${question._renderedText ?? this.renderMarkdown(question.text)}
+            </div>
+
+            <div class="space-y-3 mb-6" id="answers-container">
+                ${answersHtml}
+            </div>
+
+            ${reasonHtml}
+        `;
+    }
+
+    // Inner markup of #question-nav
+    renderQuestionNav(index) {
+        const checkButton = this.state.checked[index] ? BTN_CHECKED : BTN_CHECK;
+        const isLastQuestion = index === this.state.questions.length - 1;
+        const nextButton = isLastQuestion ? BTN_SUBMIT : BTN_NEXT;
+        const backButton = index > 0 ? BTN_PREV : '';
+
+        return `
+            <div>
+                ${backButton}
+            </div>
+            <div class="flex gap-3">
+                ${checkButton}
+                ${nextButton}
+            </div>
+        `;
+    }
+
+    // Render explanation block shown after checking an answer
+    renderReason(question) {
+        return `
+            <div class="mt-6 p-4 bg-blue-50 dark:bg-blue-900/20 border-l-4 border-blue-500 rounded">
+                <div class="flex items-center mb-2">
+                    <span class="text-2xl mr-2">💡</span>
+                    <span class="font-semibold text-blue-900 dark:text-blue-100">Uitleg</span>
+                </div>
+                <div class="text-gray-700 dark:text-gray-300 prose prose-sm dark:prose-invert max-w-none">
+                    ${question._renderedReason ?? this.renderMarkdown(question.reason)}
                 </div>
             </div>
         `;
@@ -959,28 +1287,10 @@ class QuizApp {
     renderStatistics() {
         const score = this.calculateScore();
         const timeElapsed = this.formatTime(this.getElapsedTime());
-
-        let questionsList = '';
-        this.state.questions.forEach((question, index) => {
-            const isCorrect = this.isAnswerCorrect(index);
-            const icon = isCorrect
-                ? '<span class="text-green-600 text-xl">✓</span>'
-                : '<span class="text-red-600 text-xl">✗</span>';
-
-            const shortText = question.text.length > 60
-                ? question.text.substring(0, 60) + '...'
-                : question.text;
-
-            questionsList += `
-                <div class="flex items-center p-3 border-b border-gray-200 dark:border-gray-700 hover:bg-gray-50 dark:hover:bg-gray-700 cursor-pointer"
-                     data-review-index="${index}">
-                    <span class="mr-3">${icon}</span>
-                    <span class="flex-1 text-gray-700 dark:text-gray-300">
-                        ${index + 1}. ${this.escapeHtml(shortText)}
-                    </span>
-                </div>
-            `;
-        });
+        const status = SCORE_STATUS[
+            score.percentage >= 75 ? 'passed' : score.percentage >= 50 ? 'sufficient' : 'insufficient'
+        ];
+        const ringDash = (score.percentage / 100) * SCORE_RING_CIRCUMFERENCE;
 
         return `
             <div class="max-w-4xl mx-auto">
@@ -1008,8 +1318,8 @@ class QuizApp {
                                             fill="none"
                                             stroke="currentColor"
                                             stroke-width="10"
-                                            stroke-dasharray="${score.percentage * 2.827}, 282.7"
-                                            class="${score.percentage >= 75 ? 'text-green-500' : score.percentage >= 50 ? 'text-yellow-500' : 'text-red-500'}"
+                                            stroke-dasharray="${ringDash}, ${SCORE_RING_CIRCUMFERENCE}"
+                                            class="${status.ring}"
                                             stroke-linecap="round" />
                                 </svg>
                                 <div class="absolute inset-0 flex items-center justify-center">
@@ -1037,8 +1347,8 @@ class QuizApp {
                             </div>
                             <div class="flex justify-between items-center p-4 bg-gray-50 dark:bg-gray-700 rounded-lg">
                                 <span class="text-gray-600 dark:text-gray-400">Status:</span>
-                                <span class="text-xl font-semibold ${score.percentage >= 75 ? 'text-green-600' : score.percentage >= 50 ? 'text-yellow-600' : 'text-red-600'}">
-                                    ${score.percentage >= 75 ? 'Geslaagd ✓' : score.percentage >= 50 ? 'Voldoende' : 'Onvoldoende'}
+                                <span class="text-xl font-semibold ${status.text}">
+                                    ${status.label}
                                 </span>
                             </div>
                         </div>
@@ -1049,9 +1359,7 @@ class QuizApp {
                         <h2 class="text-2xl font-bold text-gray-900 dark:text-gray-100 mb-4">
                             Vraag overzicht
                         </h2>
-                        <div class="border border-gray-200 dark:border-gray-700 rounded-lg overflow-hidden" id="questions-review">
-                            ${questionsList}
-                        </div>
+                        <div class="border border-gray-200 dark:border-gray-700 rounded-lg overflow-hidden" id="questions-review"></div>
                     </div>
 
                     <!-- Navigation -->
@@ -1070,43 +1378,66 @@ class QuizApp {
         `;
     }
 
-    // Render review page
-    renderReview(index) {
-        // Similar to renderQuestion but read-only
+    // Fill the questions review list; rows are built into a fragment and appended after the page shell
+    appendQuestionsReview(container) {
+        const correctness = this.getCorrectness();
+        const fragment = document.createDocumentFragment();
+
+        this.state.questions.forEach((question, index) => {
+            const icon = correctness[index]
+                ? '<span class="text-green-600 text-xl">✓</span>'
+                : '<span class="text-red-600 text-xl">✗</span>';
+
+            const row = document.createElement('div');
+            row.className = 'flex items-center p-3 border-b border-gray-200 dark:border-gray-700 hover:bg-gray-50 dark:hover:bg-gray-700 cursor-pointer';
+            row.dataset.reviewIndex = index;
+            row.innerHTML = `<span class="mr-3">${icon}</span>`;
+
+            const label = document.createElement('span');
+            label.className = 'flex-1 text-gray-700 dark:text-gray-300';
+            label.textContent = `${index + 1}. ${question._shortText}`;
+            row.appendChild(label);
+            fragment.appendChild(row);
+        });
+
+        container.appendChild(fragment);
+    }
+
+    // Answer list of the review page; answers are final once reviewed, so it is built once per question
+    getReviewAnswersHtml(index) {
+        const cached = this._reviewAnswersHtml[index];
+        if (cached !== undefined) {
+            return cached;
+        }
+
         const question = this.state.questions[index];
         const selectedIndices = this.state.answers[index] || [];
-        const isCorrect = this.isAnswerCorrect(index);
 
-        let answersHtml = '';
-        question.answers.forEach((answer, answerIndex) => {
-            const isSelected = selectedIndices.includes(answerIndex);
-            const isAnswerCorrect = answer.correct;
-
-            let borderClass = 'border-gray-200 dark:border-gray-700';
-            let bgClass = 'bg-white dark:bg-gray-800';
-            let icon = '';
-
-            if (isAnswerCorrect) {
-                borderClass = 'border-green-500';
-                bgClass = 'bg-green-50 dark:bg-green-900/20';
-                icon = '<span class="text-green-600 font-bold">✓</span>';
-            } else if (isSelected) {
-                borderClass = 'border-red-500';
-                bgClass = 'bg-red-50 dark:bg-red-900/20';
-                icon = '<span class="text-red-600 font-bold">✗</span>';
-            }
+        const html = question.answers.map((answer, answerIndex) => {
+            const answerState = this.getAnswerState(answer, selectedIndices.includes(answerIndex), true);
 
-            answersHtml += `
-                <div class="border-2 ${borderClass} ${bgClass} rounded-lg p-4">
+            return `
+                <div class="border-2 ${ANSWER_STYLES[answerState]} rounded-lg p-4">
                     <div class="flex items-start">
                         <div class="flex-1 text-gray-900 dark:text-gray-100 prose prose-sm dark:prose-invert max-w-none">
-                            ${this.renderMarkdown(answer.text)}
+                            ${answer._renderedText ?? this.renderMarkdown(answer.text)}
                         </div>
-                        ${icon}
+                        ${ANSWER_ICONS[answerState] || ''}
                     </div>
                 </div>
             `;
-        });
+        }).join('');
+
+        this._reviewAnswersHtml[index] = html;
+        return html;
+    }
+
+    // Render review page
+    renderReview(index) {
+        // Similar to renderQuestion but read-only
+        const question = this.state.questions[index];
+        const isCorrect = this.getCorrectness()[index];
+        const answersHtml = this.getReviewAnswersHtml(index);
 
         return `
             <div>
@@ -1124,7 +1455,7 @@ class QuizApp {
                     </div>
 
                     <div class="text-gray-900 dark:text-gray-100 mb-6 prose prose-lg dark:prose-invert max-w-none ${this.state.config.boldQuestions ? 'bold-questions' : ''}">
-                        ${this.renderMarkdown(question.text)}
+                        ${question._renderedText ?? this.renderMarkdown(question.text)}
                     </div>
 
                     <div class="space-y-3 mb-6">
@@ -1137,7 +1468,7 @@ class QuizApp {
                             <span class="font-semibold text-blue-900 dark:text-blue-100">Uitleg</span>
                         </div>
                         <div class="text-gray-700 dark:text-gray-300 prose prose-sm dark:prose-invert max-w-none">
-                            ${this.renderMarkdown(question.reason)}
+                            ${question._renderedReason ?? this.renderMarkdown(question.reason)}
                         </div>
                     </div>
                 </div>
@@ -1154,26 +1485,38 @@ class QuizApp {
 
     // Attach event listeners after rendering
     attachEventListeners() {
+        // Phase 1: look up all handles in one batch of DOM reads
+        const els = {
+            start: document.getElementById('start-quiz'),
+            timerToggle: document.getElementById('timer-toggle'),
+            card: document.getElementById('question-card'),
+            nav: document.getElementById('question-nav'),
+            restart: document.getElementById('restart-quiz'),
+            backToLast: document.getElementById('back-to-last'),
+            review: document.getElementById('questions-review'),
+            backToStats: document.getElementById('back-to-statistics')
+        };
+
+        // Phase 2: attach listeners to the collected handles
+
         // Intro page
-        const startButton = document.getElementById('start-quiz');
-        if (startButton) {
-            startButton.addEventListener('click', () => {
+        if (els.start) {
+            els.start.addEventListener('click', () => {
                 // Save config
                 this.state.config.shuffleQuestions = document.getElementById('shuffle-questions').checked;
                 this.state.config.shuffleAnswers = document.getElementById('shuffle-answers').checked;
                 this.state.config.autoAdvance = document.getElementById('auto-advance').checked;
-                this.state.config.autoAdvanceDelay = parseInt(document.getElementById('auto-advance-delay').value);
+                this.state.config.autoAdvanceDelay = parseInt(document.getElementById('auto-advance-delay').value, 10);
                 this.state.config.timerEnabled = document.getElementById('timer-enabled').checked;
-                this.state.config.timerMinutes = parseInt(document.getElementById('timer-minutes').value);
+                this.state.config.timerMinutes = parseInt(document.getElementById('timer-minutes').value, 10);
                 this.state.config.boldQuestions = document.getElementById('bold-questions').checked;
                 this.startQuiz();
             });
         }
 
         // Timer pause/resume toggle
-        const timerToggle = document.getElementById('timer-toggle');
-        if (timerToggle) {
-            timerToggle.addEventListener('click', () => {
+        if (els.timerToggle) {
+            els.timerToggle.addEventListener('click', () => {
                 if (this.state.timerPaused) {
                     this.resumeTimer();
                 } else {
@@ -1182,76 +1525,68 @@ class QuizApp {
             });
         }
 
-        // Question page - answer selection
-        const answersContainer = document.getElementById('answers-container');
-        if (answersContainer) {
-            const question = this.state.questions[this.state.currentQuestionIndex];
-            const isMultiple = question.type === 'multiple';
-
-            answersContainer.querySelectorAll('[data-answer-index]').forEach(div => {
-                div.addEventListener('click', () => {
-                    const answerIndex = parseInt(div.dataset.answerIndex);
-                    this.selectAnswer(this.state.currentQuestionIndex, answerIndex, isMultiple);
-                });
+        // Question page - answer selection, one delegated listener on the card
+        // (it outlives the card contents, which are swapped on navigation)
+        if (els.card) {
+            els.card.addEventListener('click', (event) => {
+                const div = event.target.closest('[data-answer-index]');
+                // Links in answer text navigate instead of selecting the answer
+                if (!div || event.target.closest('a')) return;
+                // Cancel label activation so the DOM patch is not toggled back
+                // by the synthetic click the label dispatches on its input
+                if (event.target.tagName !== 'INPUT') {
+                    event.preventDefault();
+                }
+                const index = this.state.currentQuestionIndex;
+                const isMultiple = this.state.questions[index].type === 'multiple';
+                this.selectAnswer(index, +div.dataset.answerIndex, isMultiple);
             });
         }
 
-        // Check answer button
-        const checkButton = document.getElementById('check-answer');
-        if (checkButton) {
-            checkButton.addEventListener('click', () => {
-                this.checkAnswer(this.state.currentQuestionIndex);
+        // Check answer and navigation buttons, one delegated listener on the nav bar
+        if (els.nav) {
+            els.nav.addEventListener('click', (event) => {
+                const button = event.target.closest('button[id]');
+                if (!button) return;
+                if (button.id === 'check-answer') {
+                    this.checkAnswer(this.state.currentQuestionIndex);
+                } else if (button.id === 'next-question') {
+                    this.nextQuestion();
+                } else if (button.id === 'prev-question') {
+                    this.previousQuestion();
+                } else if (button.id === 'submit-quiz') {
+                    this.goToStatistics();
+                }
             });
         }
 
-        // Navigation buttons
-        const nextButton = document.getElementById('next-question');
-        if (nextButton) {
-            nextButton.addEventListener('click', () => this.nextQuestion());
-        }
-
-        const prevButton = document.getElementById('prev-question');
-        if (prevButton) {
-            prevButton.addEventListener('click', () => this.previousQuestion());
-        }
-
-        const submitButton = document.getElementById('submit-quiz');
-        if (submitButton) {
-            submitButton.addEventListener('click', () => this.goToStatistics());
-        }
-
         // Statistics page
-        const restartButton = document.getElementById('restart-quiz');
-        if (restartButton) {
-            restartButton.addEventListener('click', () => {
+        if (els.restart) {
+            els.restart.addEventListener('click', () => {
                 if (confirm('Weet je zeker dat je de quiz opnieuw wilt starten? Je huidige voortgang gaat verloren.')) {
                     this.restartQuiz();
                 }
             });
         }
 
-        const backToLastButton = document.getElementById('back-to-last');
-        if (backToLastButton) {
-            backToLastButton.addEventListener('click', () => {
+        if (els.backToLast) {
+            els.backToLast.addEventListener('click', () => {
                 this.goToQuestion(this.state.questions.length - 1);
             });
         }
 
-        // Review question clicks
-        const reviewContainer = document.getElementById('questions-review');
-        if (reviewContainer) {
-            reviewContainer.querySelectorAll('[data-review-index]').forEach(div => {
-                div.addEventListener('click', () => {
-                    const index = parseInt(div.dataset.reviewIndex);
-                    this.goToReview(index);
-                });
+        // Review question clicks, one delegated listener for all rows
+        if (els.review) {
+            els.review.addEventListener('click', (event) => {
+                const row = event.target.closest('[data-review-index]');
+                if (!row || !els.review.contains(row)) return;
+                this.goToReview(+row.dataset.reviewIndex);
             });
         }
 
         // Back to statistics from review
-        const backToStatsButton = document.getElementById('back-to-statistics');
-        if (backToStatsButton) {
-            backToStatsButton.addEventListener('click', () => {
+        if (els.backToStats) {
+            els.backToStats.addEventListener('click', () => {
                 this.goToStatistics();
             });
         }
@@ -1259,25 +1594,28 @@ class QuizApp {
 
     // Utility: Escape HTML
     escapeHtml(text) {
-        const div = document.createElement('div');
-        div.textContent = text;
-        return div.innerHTML;
+        return String(text).replace(ESC_RE, c => ESC_MAP[c]);
     }
 
-    // Utility: Render Markdown
+    // Utility: Render Markdown (memoized, quiz text never changes after load)
     renderMarkdown(text) {
-        if (typeof marked !== 'undefined') {
-            return marked.parse(text);
+        const hit = this._mdCache.get(text);
+        if (hit !== undefined) {
+            return hit;
+        }
+        if (typeof marked === 'undefined') {
+            // Fallback to escaped HTML if marked.js not loaded
+            return this.escapeHtml(text);
         }
-        // Fallback to escaped HTML if marked.js not loaded
-        return this.escapeHtml(text);
+        const html = marked.parse(text);
+        this._mdCache.set(text, html);
+        return html;
     }
 
-    // Utility: Render LaTeX math formulas
-    renderLatex() {
+    // Utility: Render LaTeX math formulas (whole app or a newly inserted node)
+    renderLatex(element = document.getElementById('app')) {
         if (typeof renderMathInElement !== 'undefined') {
-            const app = document.getElementById('app');
-            renderMathInElement(app, {
+            renderMathInElement(element, {
                 delimiters: [
                     {left: '$$', right: '$$', display: true},
                     {left: '$', right: '$', display: false},
@@ -1291,23 +1629,44 @@ class QuizApp {
     }
 }
 
-// Configure marked.js with highlight.js for syntax highlighting
-if (typeof marked !== 'undefined') {
+// Highlighted code blocks keyed by language + NUL + code
+const _codeCache = new Map();
+
+// Configure marked.js with highlight.js for syntax highlighting (after assets are loaded)
+function configureMarked() {
+    if (typeof marked === 'undefined') {
+        return;
+    }
+
     const renderer = new marked.Renderer();
 
     // Custom code renderer for syntax highlighting
     if (typeof hljs !== 'undefined') {
+        const autoLangs = USED_LANGS.filter(lang => hljs.getLanguage(lang));
         renderer.code = function(code, language) {
             // Handle marked v11+ object format
             if (typeof code === 'object') {
                 language = code.lang;
                 code = code.text;
             }
+            const key = (language || '') + '\\u0000' + code;
+            const cached = _codeCache.get(key);
+            if (cached !== undefined) {
+                return cached;
+            }
+            // Untagged blocks are auto-detected among the quiz's own languages only
             const validLang = language && hljs.getLanguage(language);
-            const highlighted = validLang
-                ? hljs.highlight(code, { language: language }).value
-                : hljs.highlightAuto(code).value;
-            return '<pre><code class="hljs ' + (language || '') + '">' + highlighted + '</code></pre>';
+            let highlighted;
+            if (validLang) {
+                highlighted = hljs.highlight(code, { language }).value;
+            } else if (autoLangs.length > 0) {
+                highlighted = hljs.highlightAuto(code, autoLangs).value;
+            } else {
+                highlighted = hljs.highlight(code, { language: 'plaintext' }).value;
+            }
+            const html = '<pre><code class="hljs ' + (language || '') + '">' + highlighted + '</code></pre>';
+            _codeCache.set(key, html);
+            return html;
         };
     }
 
@@ -7,12 +7,28 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import functools
+import io
+import os
 import re
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import TextIO
 
+# Answer marker or reason marker line, matched from the newline that precedes it:
+# the literal "\n" prefix lets finditer skip ahead to line starts in C, and
+# [^\S\n] keeps whitespace matches from running across lines. For answers,
+# "(X)" fills group 1 (single), "[X]" fills group 2 (multiple) and the
+# (possibly empty) text after the marker group 3; the reason marker fills group 4
+_BLOCK_LINE_RE = re.compile(
+    r"\n(?:-[^\S\n]+(?:\(([Xx ])\)|\[([Xx ])\])[^\S\n]*(.*)$"
+    r"|[^\S\n]*(# [Rr][Ee][Aa][Ss][Oo][Nn])[^\S\n]*$)",
+    re.M,
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Answer:
     """Represents an answer option for a quiz question."""
 
@@ -20,7 +36,7 @@ class Answer:
     is_correct: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Question:
     """Represents a quiz question with answers and reasoning."""
 
@@ -59,22 +75,18 @@ class QuizParseError(Exception):
 class QuizParser:
     """Parser for quiz markdown files."""
 
-    # Regex patterns - allow empty or non-empty text after marker
-    SINGLE_CHOICE_PATTERN = re.compile(r"^-\s+\(([Xx ])\)\s*(.*)$")
-    MULTIPLE_CHOICE_PATTERN = re.compile(r"^-\s+\[([Xx ])\]\s*(.*)$")
     QUESTION_SEPARATOR = "---"
     REASON_MARKER = "# reason"
+    _REASON_MARKER_LOWER = REASON_MARKER.lower()
 
-    def __init__(self, file_path: Path) -> None:
+    def __init__(self, file_path: Path | None = None) -> None:
         """Initialize the parser with a quiz markdown file.
 
         Args:
-            file_path: Path to the quiz markdown file
+            file_path: Path to the quiz markdown file, or None if parse() is not used
         """
         self.file_path = file_path
         self.questions: list[Question] = []
-        self.all_lines: list[str] = []  # Store all lines for error reporting
-        self.line_offset: int = 0  # Track current line offset in file
 
     def parse(self) -> list[Question]:
         """Parse the quiz markdown file and extract questions.
@@ -85,53 +97,111 @@ class QuizParser:
         Raises:
             QuizParseError: If parsing fails
             FileNotFoundError: If the file doesn't exist
+            ValueError: If the parser was created without a file path
         """
+        if self.file_path is None:
+            raise ValueError("QuizParser.parse() requires a file path")
         if not self.file_path.exists():
             raise FileNotFoundError(f"Quiz file not found: {self.file_path}")
 
-        content = self.file_path.read_text(encoding="utf-8")
-        self.all_lines = content.split("\n")
+        # Stream the file; only the current block's lines are held in memory
+        with self.file_path.open(encoding="utf-8") as quiz_file:
+            return self.parse_stream(quiz_file)
 
-        # Split into question blocks
-        blocks = content.split(self.QUESTION_SEPARATOR)
+    def parse_stream(self, stream: Iterable[str]) -> list[Question]:
+        """Parse quiz markdown from an open text stream or other line iterable.
 
-        current_line = 0
-        for i, block in enumerate(blocks):
-            # Track line offset for this block
-            self.line_offset = current_line
-
-            # Count lines in this block including separator
-            block_line_count = block.count("\n") + 1
-            if i < len(blocks) - 1:  # Add separator line except for last block
-                block_line_count += 1
-
-            block = block.strip()
-            if not block:
-                current_line += block_line_count
-                continue
+        Args:
+            stream: Lines of quiz markdown, with or without trailing newline
 
-            try:
-                question = self._parse_question_block(block, i + 1)
-                self.questions.append(question)
-            except QuizParseError:
-                raise
-            except Exception as e:
-                # Create generic error without line info
-                raise QuizParseError(f"Error parsing question block {i + 1}: {e}") from e
+        Returns:
+            List of Question objects
 
-            current_line += block_line_count
+        Raises:
+            QuizParseError: If parsing fails
+        """
+        self._parse_lines(stream)
 
         if not self.questions:
             raise QuizParseError("No questions found in the quiz file")
 
         return self.questions
 
-    def _parse_question_block(self, block: str, block_number: int) -> Question:
+    def parse_text(self, content: str) -> list[Question]:
+        """Parse quiz markdown that is already in memory.
+
+        Args:
+            content: Quiz markdown text
+
+        Returns:
+            List of Question objects
+
+        Raises:
+            QuizParseError: If parsing fails
+        """
+        # Universal newlines, the same line splitting as reading the file
+        return self.parse_stream(io.StringIO(content, newline=None))
+
+    def _parse_lines(self, lines: Iterable[str]) -> None:
+        """Split lines into question blocks on separator lines and parse each block.
+
+        Args:
+            lines: Lines of the quiz file, with or without trailing newline
+
+        Raises:
+            QuizParseError: If a block format is invalid
+        """
+        block_lines: list[str] = []
+        block_start = 0
+        block_number = 1
+        separator = self.QUESTION_SEPARATOR
+        for line_idx, line in enumerate(lines):
+            line = line.removesuffix("\n")
+            # Only lines containing the separator need the stripped comparison
+            if separator in line and line.strip() == separator:
+                self._add_block(block_lines, block_number, block_start)
+                block_lines = []
+                block_start = line_idx + 1
+                block_number += 1
+            else:
+                block_lines.append(line)
+        self._add_block(block_lines, block_number, block_start)
+
+    def _add_block(self, block_lines: list[str], block_number: int, block_start: int) -> None:
+        """Parse the lines of one question block and collect the question.
+
+        Args:
+            block_lines: Lines between two separators
+            block_number: The question block number (1-indexed)
+            block_start: Line index in the file of the block's first line (0-indexed)
+
+        Raises:
+            QuizParseError: If the block format is invalid
+        """
+        raw_block = "\n".join(block_lines)
+        block = raw_block.lstrip()
+        if not block:
+            return
+
+        # Leading blank lines are stripped, so the block text starts further down
+        first_line = block_start + raw_block.count("\n", 0, len(raw_block) - len(block))
+
+        try:
+            question = self._parse_question_block(block.rstrip(), block_number, first_line)
+            self.questions.append(question)
+        except QuizParseError:
+            raise
+        except Exception as e:
+            # Create generic error without line info
+            raise QuizParseError(f"Error parsing question block {block_number}: {e}") from e
+
+    def _parse_question_block(self, block: str, block_number: int, first_line: int = 0) -> Question:
         """Parse a single question block.
 
         Args:
             block: The text block containing one question
             block_number: The question block number (1-indexed)
+            first_line: Line index in the file of the block's first line (0-indexed)
 
         Returns:
             Question object
@@ -139,85 +209,81 @@ class QuizParser:
         Raises:
             QuizParseError: If the block format is invalid
         """
-        lines = [line for line in block.split("\n")]
-
-        # Extract question text (everything before the first answer option)
-        # Preserve newlines for markdown rendering
-        question_text_lines = []
-        answer_start_idx = 0
+        lines = block.split("\n")
 
-        for i, line in enumerate(lines):
-            if self._is_answer_line(line):
-                answer_start_idx = i
+        # One finditer over the block visits only answer and reason marker lines:
+        # question text runs up to the first answer marker, each answer up to the
+        # next marker or the reason marker. Offsets are into text, where the
+        # leading newline lets the first line match like any other
+        text = "\n" + block
+        answers = []
+        question_type = None
+        mixed_type_idx = None
+        answer_start = -1  # Offset of the newline before the first answer marker
+        answer_text_end = len(text)  # Offset where the answer section ends
+        reason_start = len(text)  # Offset where the reason text begins
+        current = None  # (is_correct, first line text, offset after the marker line)
+        has_correct = False
+
+        for match in _BLOCK_LINE_RE.finditer(text):
+            single_mark, multiple_mark, first_line_text, reason = match.groups()
+
+            if reason is not None:
+                # Before the first answer, a reason marker is question text
+                if current is None:
+                    continue
+                answer_text_end = match.start()
+                reason_start = match.end()
                 break
-            question_text_lines.append(line)
 
-        # Join with newlines to preserve markdown structure (codeblocks, etc.)
-        question_text = "\n".join(question_text_lines).strip()
+            if single_mark is not None:
+                answer_type, mark = "single", single_mark
+            else:
+                answer_type, mark = "multiple", multiple_mark
 
-        if not question_text:
-            self._raise_parse_error(
-                0, lines[0] if lines else "", "No question text found", block_number, lines
-            )
+            if current is None:
+                # The first answer fixes the question type
+                question_type = answer_type
+                answer_start = match.start()
+            else:
+                if answer_type != question_type:
+                    mixed_type_idx = text.count("\n", 0, match.start())
+                    break
+                answers.append(self._build_answer(text, current, match.start()))
 
-        # Extract answers with multi-line support
-        answers = []
-        question_type = None
-        reason_start_idx = len(lines)
+            # The pattern only admits "X", "x" or " " as mark
+            is_correct = mark != " "
+            has_correct = has_correct or is_correct
+            current = (is_correct, first_line_text, match.end())
 
-        i = answer_start_idx
-        while i < len(lines):
-            line = lines[i]
+        if current is not None and mixed_type_idx is None:
+            answers.append(self._build_answer(text, current, answer_text_end))
 
-            # Check for reason marker (case-insensitive, stripped)
-            if line.strip().lower() == self.REASON_MARKER.lower():
-                reason_start_idx = i
-                break
+        answer_start_idx = text.count("\n", 0, answer_start) if answer_start >= 0 else 0
 
-            # Try to match answer marker
-            match = self.SINGLE_CHOICE_PATTERN.match(line)
-            answer_type = "single"
-            if not match:
-                match = self.MULTIPLE_CHOICE_PATTERN.match(line)
-                answer_type = "multiple"
-
-            if match:
-                # Validate question type consistency
-                if question_type is None:
-                    question_type = answer_type
-                elif question_type != answer_type:
-                    self._raise_parse_error(
-                        i,
-                        line,
-                        "Mixed answer types: Cannot mix ( ) and [ ] formats in same question",
-                        block_number,
-                        lines,
-                    )
-
-                is_correct = match.group(1).upper() == "X"
-                first_line_text = match.group(2)
-
-                # Collect multi-line answer content
-                answer_lines = [first_line_text] if first_line_text else []
-                i += 1
-
-                # Collect subsequent lines until next answer marker, reason, or end
-                while i < len(lines):
-                    next_line = lines[i]
-                    # Stop if we hit another answer marker or reason
-                    if self._is_answer_line(next_line):
-                        break
-                    if next_line.strip().lower() == self.REASON_MARKER.lower():
-                        break
-                    answer_lines.append(next_line)
-                    i += 1
-
-                # Join answer lines preserving structure for markdown
-                answer_text = "\n".join(answer_lines).strip()
-                answers.append(Answer(text=answer_text, is_correct=is_correct))
-            else:
-                # Skip empty lines between answers
-                i += 1
+        # Question text is everything before the first answer option, newlines
+        # preserved for markdown structure (codeblocks, etc.)
+        question_text = (text[:answer_start] if answer_start >= 0 else text).strip()
+
+        if not question_text:
+            self._raise_parse_error(
+                0,
+                lines[0] if lines else "",
+                "No question text found",
+                block_number,
+                lines,
+                first_line,
+            )
+
+        if mixed_type_idx is not None:
+            self._raise_parse_error(
+                mixed_type_idx,
+                lines[mixed_type_idx],
+                "Mixed answer types: Cannot mix ( ) and [ ] formats in same question",
+                block_number,
+                lines,
+                first_line,
+            )
 
         if not answers:
             # Find first line after question
@@ -228,27 +294,22 @@ class QuizParser:
                 "No answers found. Expected format: '- (X) text' or '- [X] text'",
                 block_number,
                 lines,
+                first_line,
             )
 
-        if not any(a.is_correct for a in answers):
-            # Find first answer line
-            for i in range(answer_start_idx, len(lines)):
-                if self._is_answer_line(lines[i]):
-                    self._raise_parse_error(
-                        i,
-                        lines[i],
-                        "No correct answer marked. Use (X) or [X] to mark correct answers",
-                        block_number,
-                        lines,
-                    )
-                    break
+        if not has_correct:
+            # Report at the first answer line
+            self._raise_parse_error(
+                answer_start_idx,
+                lines[answer_start_idx],
+                "No correct answer marked. Use (X) or [X] to mark correct answers",
+                block_number,
+                lines,
+                first_line,
+            )
 
         # Extract reason section - preserve newlines for markdown
-        reason_lines = []
-        for i in range(reason_start_idx + 1, len(lines)):
-            reason_lines.append(lines[i])
-
-        reason = "\n".join(reason_lines).strip()
+        reason = text[reason_start:].strip()
 
         return Question(
             text=question_text,
@@ -257,18 +318,25 @@ class QuizParser:
             question_type=question_type or "single",
         )
 
-    def _is_answer_line(self, line: str) -> bool:
-        """Check if a line is an answer option.
+    def _build_answer(self, text: str, current: tuple[bool, str, int], text_end: int) -> Answer:
+        """Build an answer from its marker line text and the lines that follow it.
 
         Args:
-            line: The line to check
+            text: The question block text
+            current: Correctness, marker line text and offset after the marker line
+            text_end: Offset in the text where the answer's lines end
 
         Returns:
-            True if the line matches answer format
+            Answer object
         """
-        return bool(
-            self.SINGLE_CHOICE_PATTERN.match(line) or self.MULTIPLE_CHOICE_PATTERN.match(line)
-        )
+        is_correct, first_line_text, text_start = current
+        if text_start >= text_end:
+            # Single-line answer: nothing to concatenate
+            answer_text = first_line_text.strip()
+        else:
+            # Keep the answer's lines as they are, preserving structure for markdown
+            answer_text = (first_line_text + text[text_start:text_end]).strip()
+        return Answer(text=answer_text, is_correct=is_correct)
 
     def _raise_parse_error(
         self,
@@ -277,6 +345,7 @@ class QuizParser:
         error_message: str,
         block_number: int,
         block_lines: list[str],
+        first_line: int = 0,
     ) -> None:
         """Raise a QuizParseError with detailed line information.
 
@@ -286,23 +355,17 @@ class QuizParser:
             error_message: Description of the error
             block_number: Question block number (1-indexed)
             block_lines: All lines in the current block
+            first_line: Line index in the file of the block's first line (0-indexed)
 
         Raises:
             QuizParseError: Always raised with detailed error info
         """
         # Calculate absolute line number in file
-        absolute_line = self.line_offset + line_idx_in_block + 1  # +1 for 1-indexed
+        absolute_line = first_line + line_idx_in_block + 1  # +1 for 1-indexed
 
         # Get context lines (2 before, 2 after)
-        context_before = []
-        context_after = []
-
-        for i in range(max(0, line_idx_in_block - 2), line_idx_in_block):
-            if i < len(block_lines):
-                context_before.append(block_lines[i])
-
-        for i in range(line_idx_in_block + 1, min(len(block_lines), line_idx_in_block + 3)):
-            context_after.append(block_lines[i])
+        context_before = block_lines[max(0, line_idx_in_block - 2) : line_idx_in_block]
+        context_after = block_lines[line_idx_in_block + 1 : line_idx_in_block + 3]
 
         parse_error = ParseError(
             line_number=absolute_line,
@@ -316,11 +379,15 @@ class QuizParser:
         raise QuizParseError(f"Error at line {absolute_line}: {error_message}", parse_error)
 
 
-def parse_quiz_file(file_path: Path) -> list[Question]:
+def parse_quiz_file(file_path: str | os.PathLike[str] | TextIO) -> list[Question]:
     """Parse a quiz markdown file.
 
+    Results are cached per file path, modification time and size, so
+    exporting the same unchanged quiz to several formats parses it once.
+    An already open text stream is parsed directly and not cached.
+
     Args:
-        file_path: Path to the quiz markdown file
+        file_path: Path to the quiz markdown file, or an open text stream
 
     Returns:
         List of Question objects
@@ -329,5 +396,51 @@ def parse_quiz_file(file_path: Path) -> list[Question]:
         QuizParseError: If parsing fails
         FileNotFoundError: If the file doesn't exist
     """
-    parser = QuizParser(file_path)
-    return parser.parse()
+    if not isinstance(file_path, (str, os.PathLike)):
+        return QuizParser().parse_stream(file_path)
+
+    file_path = Path(file_path)
+
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Quiz file not found: {file_path}") from None
+
+    questions = _parse_quiz_file_cached(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    # Copy each question's answer list as well, so callers can reorder or extend
+    # the questions and their answers without touching the cache
+    return [replace(question, answers=list(question.answers)) for question in questions]
+
+
+def parse_quiz_text(content: str) -> list[Question]:
+    """Parse quiz markdown text without reading a file.
+
+    Args:
+        content: Quiz markdown text
+
+    Returns:
+        List of Question objects
+
+    Raises:
+        QuizParseError: If parsing fails
+    """
+    return QuizParser().parse_text(content)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_quiz_file_cached(path: str, mtime_ns: int, size: int) -> tuple[Question, ...]:
+    """Parse a quiz file, cached on its path, modification time and size.
+
+    Args:
+        path: Resolved path to the quiz markdown file
+        mtime_ns: File modification time in nanoseconds, part of the cache key
+        size: File size in bytes, part of the cache key
+
+    Returns:
+        Tuple of Question objects
+
+    Raises:
+        QuizParseError: If parsing fails
+        FileNotFoundError: If the file doesn't exist
+    """
+    return tuple(QuizParser(Path(path)).parse())
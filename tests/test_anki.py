@@ -17,7 +17,7 @@ from markdown_quiz_exporter_tool.anki import (
 from markdown_quiz_exporter_tool.quiz_parser import Answer, Question
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def single_choice_question() -> Question:
     """Create a single choice question."""
     return Question(
@@ -32,7 +32,7 @@ def single_choice_question() -> Question:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_choice_question() -> Question:
     """Create a multiple choice question."""
     return Question(
@@ -47,7 +47,7 @@ def multiple_choice_question() -> Question:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def five_option_question() -> Question:
     """Create a question with exactly 5 options."""
     return Question(
@@ -4,10 +4,13 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+from io import BytesIO
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 from docx import Document
+from docx.document import Document as DocumentObject
 
 from markdown_quiz_exporter_tool.docx import (
     CHECKBOX_CHECKED,
@@ -18,7 +21,26 @@ from markdown_quiz_exporter_tool.docx import (
 from markdown_quiz_exporter_tool.quiz_parser import Answer, Question
 
 
-@pytest.fixture
+class ExportedDocx(NamedTuple):
+    """A DOCX document exported in memory and opened for read-only assertions."""
+
+    count: int
+    document: DocumentObject
+    paragraphs: list[str]
+    full_text: str
+
+
+def _export_and_open(questions: list[Question]) -> ExportedDocx:
+    """Export questions to an in-memory DOCX file and read back its paragraph texts."""
+    buffer = BytesIO()
+    count = export_to_docx(questions, buffer)
+    buffer.seek(0)
+    doc = Document(buffer)
+    paragraphs = [p.text for p in doc.paragraphs]
+    return ExportedDocx(count, doc, paragraphs, "\n".join(paragraphs))
+
+
+@pytest.fixture(scope="session")
 def single_choice_question() -> Question:
     """Create a single choice question."""
     return Question(
@@ -33,7 +55,7 @@ def single_choice_question() -> Question:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_choice_question() -> Question:
     """Create a multiple choice question."""
     return Question(
@@ -48,7 +70,7 @@ def multiple_choice_question() -> Question:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def question_with_code() -> Question:
     """Create a question with code block."""
     return Question(
@@ -62,6 +84,20 @@ def question_with_code() -> Question:
     )
 
 
+@pytest.fixture(scope="session")
+def single_choice_docx(single_choice_question: Question) -> ExportedDocx:
+    """Export the single choice question once for all read-only tests."""
+    return _export_and_open([single_choice_question])
+
+
+@pytest.fixture(scope="session")
+def two_questions_docx(
+    single_choice_question: Question, multiple_choice_question: Question
+) -> ExportedDocx:
+    """Export the single and multiple choice questions once for all read-only tests."""
+    return _export_and_open([single_choice_question, multiple_choice_question])
+
+
 def test_export_creates_file(tmp_path: Path, single_choice_question: Question) -> None:
     """Test that export creates a DOCX file."""
     output_file = tmp_path / "output.docx"
@@ -71,147 +107,78 @@ def test_export_creates_file(tmp_path: Path, single_choice_question: Question) -
     assert output_file.exists()
 
 
-def test_export_returns_question_count(
-    tmp_path: Path, single_choice_question: Question, multiple_choice_question: Question
-) -> None:
+def test_export_returns_question_count(two_questions_docx: ExportedDocx) -> None:
     """Test that export returns correct question count."""
-    output_file = tmp_path / "output.docx"
-    count = export_to_docx([single_choice_question, multiple_choice_question], output_file)
-
-    assert count == 2
+    assert two_questions_docx.count == 2
 
 
-def test_docx_contains_question_text(tmp_path: Path, single_choice_question: Question) -> None:
+def test_docx_contains_question_text(single_choice_docx: ExportedDocx) -> None:
     """Test that DOCX contains question text."""
-    output_file = tmp_path / "output.docx"
-    export_to_docx([single_choice_question], output_file)
-
-    doc = Document(str(output_file))
-    full_text = "\n".join(p.text for p in doc.paragraphs)
+    full_text = single_choice_docx.full_text
 
     assert "S3 object" in full_text
 
 
-def test_docx_contains_numbered_questions(
-    tmp_path: Path, single_choice_question: Question, multiple_choice_question: Question
-) -> None:
+def test_docx_contains_numbered_questions(two_questions_docx: ExportedDocx) -> None:
     """Test that questions are numbered."""
-    output_file = tmp_path / "output.docx"
-    export_to_docx([single_choice_question, multiple_choice_question], output_file)
-
-    doc = Document(str(output_file))
-    full_text = "\n".join(p.text for p in doc.paragraphs)
+    full_text = two_questions_docx.full_text
 
     assert "1." in full_text
     assert "2." in full_text
 
 
-def test_docx_contains_checkboxes(tmp_path: Path, single_choice_question: Question) -> None:
-    """Test that DOCX contains checkbox characters."""
-    output_file = tmp_path / "output.docx"
-    export_to_docx([single_choice_question], output_file)
-
-    doc = Document(str(output_file))
-    full_text = "\n".join(p.text for p in doc.paragraphs)
-
-    # Should have one checked and two unchecked
-    assert CHECKBOX_CHECKED in full_text
-    assert CHECKBOX_UNCHECKED in full_text
+@pytest.mark.parametrize(
+    ("checkbox", "answer"),
+    [(CHECKBOX_CHECKED, "5000"), (CHECKBOX_UNCHECKED, "1000")],
+)
+def test_docx_answer_checkbox(single_choice_docx: ExportedDocx, checkbox: str, answer: str) -> None:
+    """Test that correct answers get a checked and incorrect answers an unchecked checkbox."""
+    assert any(checkbox in p and answer in p for p in single_choice_docx.paragraphs)
 
 
-def test_docx_contains_reason_label(tmp_path: Path, single_choice_question: Question) -> None:
+def test_docx_contains_reason_label(single_choice_docx: ExportedDocx) -> None:
     """Test that DOCX contains 'Reason:' label."""
-    output_file = tmp_path / "output.docx"
-    export_to_docx([single_choice_question], output_file)
-
-    doc = Document(str(output_file))
-    full_text = "\n".join(p.text for p in doc.paragraphs)
+    full_text = single_choice_docx.full_text
 
     assert "Reason:" in full_text
 
 
-def test_docx_contains_reason_text(tmp_path: Path, single_choice_question: Question) -> None:
+def test_docx_contains_reason_text(single_choice_docx: ExportedDocx) -> None:
     """Test that DOCX contains reason content."""
-    output_file = tmp_path / "output.docx"
-    export_to_docx([single_choice_question], output_file)
-
-    doc = Document(str(output_file))
-    full_text = "\n".join(p.text for p in doc.paragraphs)
+    full_text = single_choice_docx.full_text
 
     assert "5TB" in full_text
 
 
-def test_docx_question_with_inline_code(tmp_path: Path, question_with_code: Question) -> None:
+def test_docx_question_with_inline_code(question_with_code: Question) -> None:
     """Test handling of inline code."""
-    output_file = tmp_path / "output.docx"
-    export_to_docx([question_with_code], output_file)
-
-    doc = Document(str(output_file))
-    full_text = "\n".join(p.text for p in doc.paragraphs)
+    full_text = _export_and_open([question_with_code]).full_text
 
     assert "print()" in full_text
     assert "hello" in full_text
 
 
 def test_docx_multiple_questions_count(
-    tmp_path: Path, single_choice_question: Question, multiple_choice_question: Question
+    single_choice_question: Question, multiple_choice_question: Question
 ) -> None:
     """Test export with multiple questions."""
-    output_file = tmp_path / "output.docx"
     questions = [single_choice_question, multiple_choice_question]
 
-    count = export_to_docx(questions, output_file)
+    count = export_to_docx(questions, BytesIO())
 
     assert count == 2
 
 
-def test_docx_answer_options(tmp_path: Path, single_choice_question: Question) -> None:
+def test_docx_answer_options(single_choice_docx: ExportedDocx) -> None:
     """Test that all answer options are included."""
-    output_file = tmp_path / "output.docx"
-    export_to_docx([single_choice_question], output_file)
-
-    doc = Document(str(output_file))
-    full_text = "\n".join(p.text for p in doc.paragraphs)
+    full_text = single_choice_docx.full_text
 
     assert "1000" in full_text
     assert "5000" in full_text
     assert "10000" in full_text
 
 
-def test_docx_correct_checkbox_for_correct_answer(
-    tmp_path: Path, single_choice_question: Question
-) -> None:
-    """Test that correct answer has checked checkbox."""
-    output_file = tmp_path / "output.docx"
-    export_to_docx([single_choice_question], output_file)
-
-    doc = Document(str(output_file))
-    paragraphs = [p.text for p in doc.paragraphs]
-
-    # Find paragraph that starts with checkbox and contains correct answer
-    correct_answer_para = [p for p in paragraphs if CHECKBOX_CHECKED in p and "5000" in p]
-    assert len(correct_answer_para) >= 1
-    assert CHECKBOX_CHECKED in correct_answer_para[0]
-
-
-def test_docx_unchecked_checkbox_for_incorrect_answer(
-    tmp_path: Path, single_choice_question: Question
-) -> None:
-    """Test that incorrect answers have unchecked checkboxes."""
-    output_file = tmp_path / "output.docx"
-    export_to_docx([single_choice_question], output_file)
-
-    doc = Document(str(output_file))
-    paragraphs = [p.text for p in doc.paragraphs]
-
-    # Find paragraph with checkbox and incorrect answer "1000" (not "10000")
-    incorrect_answer_para = [p for p in paragraphs if CHECKBOX_UNCHECKED in p]
-    assert len(incorrect_answer_para) >= 1  # At least 2 incorrect answers
-    # At least one should have unchecked checkbox
-    assert any(CHECKBOX_UNCHECKED in p for p in incorrect_answer_para)
-
-
-def test_docx_no_reason(tmp_path: Path) -> None:
+def test_docx_no_reason() -> None:
     """Test export when question has no reason."""
     question = Question(
         text="Test question?",
@@ -220,26 +187,15 @@ def test_docx_no_reason(tmp_path: Path) -> None:
         question_type="single",
     )
 
-    output_file = tmp_path / "output.docx"
-    export_to_docx([question], output_file)
-
-    doc = Document(str(output_file))
-    full_text = "\n".join(p.text for p in doc.paragraphs)
+    full_text = _export_and_open([question]).full_text
 
     # Should have question and answer but no Reason: label
     assert "Test question?" in full_text
     assert "Reason:" not in full_text
 
 
-def test_docx_exporter_instance() -> None:
+def test_docx_exporter_instance(single_choice_question: Question) -> None:
     """Test DocxExporter can be instantiated."""
-    question = Question(
-        text="Q?",
-        answers=[Answer(text="A", is_correct=True)],
-        reason="R",
-        question_type="single",
-    )
-
-    exporter = DocxExporter([question])
-    assert exporter.questions == [question]
+    exporter = DocxExporter([single_choice_question])
+    assert exporter.questions == [single_choice_question]
     assert exporter.document is not None
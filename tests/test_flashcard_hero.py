@@ -15,7 +15,7 @@ from markdown_quiz_exporter_tool.flashcard_hero import (
 from markdown_quiz_exporter_tool.quiz_parser import Answer, Question
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def single_choice_question() -> Question:
     """Create a single choice question."""
     return Question(
@@ -30,7 +30,7 @@ def single_choice_question() -> Question:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_choice_question() -> Question:
     """Create a multiple choice question."""
     return Question(
@@ -45,7 +45,7 @@ def multiple_choice_question() -> Question:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def markdown_formatted_question() -> Question:
     """Create a question with markdown formatting."""
     return Question(
@@ -223,3 +223,11 @@ def test_strip_markdown_links(tmp_path: Path) -> None:
 
     assert "[" not in back
     assert "link" in back
+
+
+def test_strip_markdown_combined() -> None:
+    """Test stripping adjacent and nested bold, italic, code and links in one string."""
+    exporter = FlashcardHeroExporter([])
+    text = "**a****b** *c* `d` [e](http://x/y) **bold *and italic*** [`code link`](u)"
+
+    assert exporter._strip_markdown(text) == "ab c d e bold and italic code link"
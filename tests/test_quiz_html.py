@@ -5,15 +5,21 @@ and has been reviewed and tested by a human.
 """
 
 import json
+import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
 
-from markdown_quiz_exporter_tool.quiz_html import QuizHTMLGenerator, export_to_quiz_html
+from markdown_quiz_exporter_tool.quiz_html import (
+    QuizHTMLGenerator,
+    _compact_whitespace,
+    export_to_quiz_html,
+)
 from markdown_quiz_exporter_tool.quiz_parser import Answer, Question
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def single_choice_question() -> Question:
     """Create a single choice question."""
     return Question(
@@ -28,7 +34,7 @@ def single_choice_question() -> Question:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_choice_question() -> Question:
     """Create a multiple choice question."""
     return Question(
@@ -43,6 +49,12 @@ def multiple_choice_question() -> Question:
     )
 
 
+@pytest.fixture(scope="session")
+def single_choice_html(single_choice_question: Question) -> str:
+    """Render the single choice quiz once for all read-only tests."""
+    return QuizHTMLGenerator([single_choice_question], "Test Quiz").render()
+
+
 def test_quiz_html_generation_basic(tmp_path: Path, single_choice_question: Question) -> None:
     """Test basic HTML generation."""
     output = tmp_path / "test.html"
@@ -54,6 +66,7 @@ def test_quiz_html_generation_basic(tmp_path: Path, single_choice_question: Ques
     assert file_size > 0
 
     content = output.read_text(encoding="utf-8")
+    assert file_size == len(content.encode("utf-8"))
 
     # Verify HTML structure
     assert "<!DOCTYPE html>" in content
@@ -62,62 +75,48 @@ def test_quiz_html_generation_basic(tmp_path: Path, single_choice_question: Ques
     assert "</html>" in content
 
 
-def test_tailwind_cdn_included(tmp_path: Path, single_choice_question: Question) -> None:
-    """Test that Tailwind CSS CDN is included."""
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([single_choice_question], "Test")
-
-    generator.generate(output)
-    content = output.read_text()
-
-    assert "cdn.tailwindcss.com" in content
-
-
-def test_quiz_data_embedded(tmp_path: Path, single_choice_question: Question) -> None:
-    """Test that quiz data is embedded as JSON."""
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([single_choice_question], "Test Quiz")
-
-    generator.generate(output)
-    content = output.read_text()
-
-    # Check for quiz data
-    assert "const QUIZ_DATA = " in content
-    assert "What is the max size" in content  # Question text without category
-    assert "5000" in content
-
-
-def test_quiz_app_javascript_included(tmp_path: Path, single_choice_question: Question) -> None:
-    """Test that QuizApp JavaScript is included."""
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([single_choice_question], "Test")
-
-    generator.generate(output)
-    content = output.read_text()
-
-    # Check for quiz application code
-    assert "class QuizApp" in content
-    assert "constructor(quizData)" in content
-    assert "initializeState()" in content
-    assert "render()" in content
-
-
-def test_dark_mode_support(tmp_path: Path, single_choice_question: Question) -> None:
-    """Test that dark mode support is included."""
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([single_choice_question], "Test")
-
-    generator.generate(output)
-    content = output.read_text()
-
-    # Check for dark mode classes
-    assert "dark:bg-gray-900" in content
-    assert "dark:bg-gray-800" in content
-    assert "darkMode: 'class'" in content  # Tailwind dark mode config
-    assert "detectDarkMode()" in content  # System preference detection
-
-
-def test_category_extraction(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    "needles",
+    [
+        pytest.param(["cdn.tailwindcss.com"], id="tailwind"),
+        pytest.param(["const QUIZ_DATA = ", "What is the max size", "5000"], id="quiz-data"),
+        pytest.param(
+            ["class QuizApp", "constructor(quizData)", "initializeState()", "render()"],
+            id="quiz-app",
+        ),
+        pytest.param(
+            ["dark:bg-gray-900", "dark:bg-gray-800", "darkMode: 'class'", "detectDarkMode()"],
+            id="dark-mode",
+        ),
+        pytest.param(["sessionStorage", "saveState()", "loadState()"], id="session-storage"),
+        pytest.param(
+            [
+                "goToIntro()",
+                "goToQuestion(",
+                "goToStatistics()",
+                "goToReview(",
+                "nextQuestion()",
+                "previousQuestion()",
+            ],
+            id="navigation",
+        ),
+        pytest.param(
+            ["shuffleArray(", "applyShuffling()", "shuffleQuestions", "shuffleAnswers"],
+            id="shuffle",
+        ),
+        pytest.param(
+            ["marked", "jsdelivr.net/npm/marked", "renderMarkdown(text)", "marked.parse"],
+            id="markdown",
+        ),
+    ],
+)
+def test_page_includes(single_choice_html: str, needles: list[str]) -> None:
+    """Test that the page includes the scripts, data and features of each group."""
+    for needle in needles:
+        assert needle in single_choice_html
+
+
+def test_category_extraction() -> None:
     """Test category extraction from question text."""
     question = Question(
         text="STAKEHOLDERS: Bij welke stakeholders ligt het belang?",
@@ -126,17 +125,26 @@ def test_category_extraction(tmp_path: Path) -> None:
         question_type="single",
     )
 
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([question], "Test")
-
-    generator.generate(output)
-    content = output.read_text()
+    content = QuizHTMLGenerator([question], "Test").render()
 
     # Category should be extracted and clean question text used
     assert "STAKEHOLDERS" in content
     assert "Bij welke stakeholders ligt het belang?" in content
 
 
+def test_split_category() -> None:
+    """Test that only short all-caps prefixes are treated as category."""
+    generator = QuizHTMLGenerator([], "Test")
+
+    assert generator._split_category("S3: What is S3?") == ("S3", "What is S3?")
+    assert generator._split_category("AWS EC2 : Pick one") == ("AWS EC2", "Pick one")
+    assert generator._split_category("What is 3:4?") == ("", "What is 3:4?")
+    assert generator._split_category("Note: lowercase") == ("", "Note: lowercase")
+
+    for category in ["CI/CD", "C++", "EC2 (AWS)", "2024 EXAM", "R&D", "AWS S3.API", "ÉCONOMIE"]:
+        assert generator._split_category(f"{category}: Question?") == (category, "Question?")
+
+
 def test_multiple_questions(
     tmp_path: Path,
     single_choice_question: Question,
@@ -158,7 +166,7 @@ def test_multiple_questions(
     assert "leadership" in content
 
 
-def test_html_escaping(tmp_path: Path) -> None:
+def test_html_escaping() -> None:
     """Test that HTML is properly escaped."""
     question = Question(
         text="What does <script>alert('xss')</script> do?",
@@ -169,16 +177,30 @@ def test_html_escaping(tmp_path: Path) -> None:
         question_type="single",
     )
 
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([question], "Test & Quiz")
-
-    generator.generate(output)
-    content = output.read_text()
+    content = QuizHTMLGenerator([question], "Test & Quiz").render()
 
     # Title should be escaped
     assert "<title>Test &amp; Quiz</title>" in content
 
 
+def test_quiz_data_script_block() -> None:
+    """Test that quiz data is embedded as a JSON block that cannot close its script tag."""
+    question = Question(
+        text="What does </script><!-- do?",
+        answers=[Answer(text="Breaks out", is_correct=True)],
+        reason="",
+        question_type="single",
+    )
+
+    content = QuizHTMLGenerator([question], "Test").render()
+
+    start = content.index('<script id="quiz-data" type="application/json">')
+    block = content[start:].split(">", 1)[1].split("</script>", 1)[0]
+
+    assert "<!--" not in block
+    assert json.loads(block)["questions"][0]["text"] == "What does </script><!-- do?"
+
+
 def test_question_to_dict_structure(single_choice_question: Question) -> None:
     """Test question dictionary structure."""
     generator = QuizHTMLGenerator([single_choice_question], "Test")
@@ -208,67 +230,68 @@ def test_quiz_data_json_format(single_choice_question: Question) -> None:
     assert data["questions"][0]["type"] == "single"
 
 
-def test_responsive_classes(tmp_path: Path, single_choice_question: Question) -> None:
-    """Test that responsive classes are included."""
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([single_choice_question], "Test")
-
-    generator.generate(output)
-    content = output.read_text()
-
-    # Check for responsive breakpoints
-    assert "md:grid-cols-2" in content or "sm:" in content or "lg:" in content
-
-
-def test_session_storage_code(tmp_path: Path, single_choice_question: Question) -> None:
-    """Test that session storage code is included."""
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([single_choice_question], "Test")
-
-    generator.generate(output)
-    content = output.read_text()
-
-    assert "sessionStorage" in content
-    assert "saveState()" in content
-    assert "loadState()" in content
+def test_code_languages_collected() -> None:
+    """Test that fenced code block languages are collected for highlighting."""
+    question = Question(
+        text="What does this print?\n\n```Python\nprint(1)\n```",
+        answers=[
+            Answer(text="```js\nconsole.log(1)\n```", is_correct=True),
+            Answer(text="```\nplain\n```", is_correct=False),
+        ],
+        reason="~~~ bash\necho 1\n~~~",
+        question_type="single",
+    )
+    generator = QuizHTMLGenerator([question], "Test")
 
+    data = json.loads(generator._build_quiz_data())
 
-def test_navigation_functions(tmp_path: Path, single_choice_question: Question) -> None:
-    """Test that navigation functions are included."""
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([single_choice_question], "Test")
+    assert data["languages"] == ["bash", "js", "python"]
 
-    generator.generate(output)
-    content = output.read_text()
 
-    assert "goToIntro()" in content
-    assert "goToQuestion(" in content
-    assert "goToStatistics()" in content
-    assert "goToReview(" in content
-    assert "nextQuestion()" in content
-    assert "previousQuestion()" in content
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_scoring_with_more_than_31_answers() -> None:
+    """Test that answers past bit 31 are scored by index, not by a wrapped bitmask."""
+    answers = [Answer(text=f"Option {i}", is_correct=i == 0) for i in range(40)]
+    question = Question(
+        text="Pick the first option", answers=answers, reason="", question_type="single"
+    )
+    html = QuizHTMLGenerator([question], "Many answers").render()
+
+    data_tag = '<script id="quiz-data" type="application/json">'
+    data = html.split(data_tag, 1)[1].split("</script>", 1)[0]
+    script = html.rsplit("<script>", 1)[1].split("</script>", 1)[0]
+    harness = (
+        f"const document = {{getElementById: () => ({{textContent: {json.dumps(data)}}})}};\n"
+        + script.replace("const quizApp = new QuizApp(QUIZ_DATA);", "")
+        + """
+const app = Object.create(QuizApp.prototype);
+const question = QUIZ_DATA.questions[0];
+question.correctMask = app.getCorrectMask(question.answers);
+app.state = {questions: [question], answers: {}};
+console.log(JSON.stringify([[0], [32], [0, 32]].map(selected => {
+    app.state.answers[0] = selected;
+    return app.isAnswerCorrect(0);
+})));
+"""
+    )
+    result = subprocess.run(["node", "-e", harness], capture_output=True, text=True, check=True)
 
+    assert json.loads(result.stdout) == [True, False, False]
 
-def test_shuffle_functions(tmp_path: Path, single_choice_question: Question) -> None:
-    """Test that shuffle functionality is included."""
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([single_choice_question], "Test")
 
-    generator.generate(output)
-    content = output.read_text()
+def test_responsive_classes(single_choice_html: str) -> None:
+    """Test that responsive classes are included."""
+    content = single_choice_html
 
-    assert "shuffleArray(" in content
-    assert "applyShuffling()" in content
-    assert "shuffleQuestions" in content
-    assert "shuffleAnswers" in content
+    # Check for responsive breakpoints
+    assert "md:grid-cols-2" in content or "sm:" in content or "lg:" in content
 
 
-def test_file_size_reasonable(tmp_path: Path, single_choice_question: Question) -> None:
+def test_file_size_reasonable(single_choice_question: Question) -> None:
     """Test that generated file size is reasonable."""
-    output = tmp_path / "test.html"
     questions = [single_choice_question] * 10  # 10 questions
 
-    file_size = export_to_quiz_html(questions, output, "Test")
+    file_size = len(QuizHTMLGenerator(questions, "Test").render().encode("utf-8"))
 
     # Should be less than 100KB for 10 questions
     assert file_size < 100 * 1024
@@ -277,18 +300,8 @@ def test_file_size_reasonable(tmp_path: Path, single_choice_question: Question)
     assert file_size > 20 * 1024
 
 
-def test_markdown_rendering_support(tmp_path: Path, single_choice_question: Question) -> None:
-    """Test that markdown rendering is included."""
-    output = tmp_path / "test.html"
-    generator = QuizHTMLGenerator([single_choice_question], "Test")
-
-    generator.generate(output)
-    content = output.read_text()
-
-    # Check for marked.js CDN
-    assert "marked" in content
-    assert "jsdelivr.net/npm/marked" in content
+def test_compact_whitespace() -> None:
+    """Test that template indentation and blank lines are stripped."""
+    source = "\n    const a = 1;\n    \n\n        <div>\n            x\n        </div>  \n"
 
-    # Check for renderMarkdown function
-    assert "renderMarkdown(text)" in content
-    assert "marked.parse" in content
+    assert _compact_whitespace(source) == "const a = 1;\n<div>\nx\n</div>"
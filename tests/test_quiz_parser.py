@@ -4,21 +4,23 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import re
+from dataclasses import FrozenInstanceError
+from io import StringIO
 from pathlib import Path
 
 import pytest
 
 from markdown_quiz_exporter_tool.quiz_parser import (
     ParseError,
+    Question,
     QuizParseError,
     parse_quiz_file,
+    parse_quiz_text,
 )
 
-
-@pytest.fixture
-def sample_quiz_content() -> str:
-    """Sample quiz markdown content."""
-    return """What is the max size of an S3 object in GB?
+# Sample quiz markdown content, encoded once for the file fixtures
+_SAMPLE_CONTENT = """What is the max size of an S3 object in GB?
 
 - ( ) 1000
 - (X) 5000
@@ -39,19 +41,32 @@ What are characteristics of effective leadership? (Multiple answers)
 # reason
 Leadership requires motivation and clear communication.
 """
+_SAMPLE_BYTES = _SAMPLE_CONTENT.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def quiz_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one directory for all quiz files; tests give their files unique names."""
+    return tmp_path_factory.mktemp("quizzes")
 
 
-@pytest.fixture
-def temp_quiz_file(tmp_path: Path, sample_quiz_content: str) -> Path:
+@pytest.fixture(scope="session")
+def temp_quiz_file(quiz_dir: Path) -> Path:
     """Create a temporary quiz file."""
-    quiz_file = tmp_path / "test_quiz.md"
-    quiz_file.write_text(sample_quiz_content, encoding="utf-8")
+    quiz_file = quiz_dir / "test_quiz.md"
+    quiz_file.write_bytes(_SAMPLE_BYTES)
     return quiz_file
 
 
-def test_parse_single_choice_question(temp_quiz_file: Path) -> None:
+@pytest.fixture(scope="session")
+def parsed_sample(temp_quiz_file: Path) -> list[Question]:
+    """Parse the sample quiz file once for all read-only tests."""
+    return parse_quiz_file(temp_quiz_file)
+
+
+def test_parse_single_choice_question(parsed_sample: list[Question]) -> None:
     """Test parsing a single choice question."""
-    questions = parse_quiz_file(temp_quiz_file)
+    questions = parsed_sample
 
     assert len(questions) == 2
 
@@ -67,9 +82,9 @@ def test_parse_single_choice_question(temp_quiz_file: Path) -> None:
     assert correct[0].text == "5000"
 
 
-def test_parse_multiple_choice_question(temp_quiz_file: Path) -> None:
+def test_parse_multiple_choice_question(parsed_sample: list[Question]) -> None:
     """Test parsing a multiple choice question."""
-    questions = parse_quiz_file(temp_quiz_file)
+    questions = parsed_sample
 
     # Check second question (multiple choice)
     q2 = questions[1]
@@ -80,69 +95,155 @@ def test_parse_multiple_choice_question(temp_quiz_file: Path) -> None:
     # Check correct answers
     correct = [a for a in q2.answers if a.is_correct]
     assert len(correct) == 2
-    assert any("motivate" in a.text for a in correct)
-    assert any("communication" in a.text for a in correct)
+    correct_texts = " | ".join(a.text for a in correct)
+    assert "motivate" in correct_texts
+    assert "communication" in correct_texts
 
 
-def test_parse_reason_section(temp_quiz_file: Path) -> None:
+def test_parse_reason_section(parsed_sample: list[Question]) -> None:
     """Test parsing the reason section."""
-    questions = parse_quiz_file(temp_quiz_file)
+    questions = parsed_sample
 
     q1 = questions[0]
     assert "5TB" in q1.reason
     assert "5000GB" in q1.reason
 
 
-def test_missing_correct_answer(tmp_path: Path) -> None:
-    """Test error when no correct answer is marked."""
-    content = """Question?
+# (content, error message pattern, expected ParseError fields) per invalid question
+_PARSE_ERROR_CASES = [
+    pytest.param(
+        """Question?
 
 - ( ) Answer 1
 - ( ) Answer 2
 
 # reason
 Some reason.
-"""
-    quiz_file = tmp_path / "invalid.md"
-    quiz_file.write_text(content, encoding="utf-8")
+""",
+        "No correct answer",
+        {},
+        id="missing-correct-answer",
+    ),
+    pytest.param(
+        """Question?
 
-    with pytest.raises(QuizParseError, match="No correct answer"):
-        parse_quiz_file(quiz_file)
+- (X) Answer 1
+- [ ] Answer 2
+
+# reason
+Mixed types.
+""",
+        "Mixed answer types",
+        {},
+        id="mixed-answer-types",
+    ),
+    pytest.param(
+        """What is the answer?
+
+- ( ) Wrong 1
+- (X) Correct
+- [ ] Wrong 2
+
+# reason
+This has mixed types.
+""",
+        "Mixed answer types",
+        {"line_number": 5, "block_number": 1, "context_before": ["- ( ) Wrong 1", "- (X) Correct"]},
+        id="mixed-types-detail",
+    ),
+    pytest.param(
+        """Which are colors?
+
+- [ ] Red
+- [ ] Blue
+- [ ] Green
+
+# reason
+All wrong!
+""",
+        re.escape("No correct answer marked. Use (X) or [X]"),
+        {"line_number": 3},
+        id="no-correct-answer-detail",
+    ),
+    pytest.param(
+        """This is a question with no answers?
+
+# reason
+No answer options provided.
+""",
+        re.escape("No answers found. Expected format: '- (X) text'"),
+        {},
+        id="no-answers",
+    ),
+    pytest.param(
+        """
+- (X) Answer 1
+- ( ) Answer 2
+
+# reason
+Answers without a question.
+""",
+        "No question text found",
+        {"block_number": 1},
+        id="no-question-text",
+    ),
+]
+
+
+@pytest.mark.parametrize(("content", "match", "attrs"), _PARSE_ERROR_CASES)
+def test_parse_errors(content: str, match: str, attrs: dict[str, object]) -> None:
+    """Test that invalid questions raise QuizParseError with detailed error info."""
+    with pytest.raises(QuizParseError, match=match) as exc_info:
+        parse_quiz_text(content)
+
+    err = exc_info.value.parse_error
+    assert isinstance(err, ParseError)
+    for name, value in attrs.items():
+        assert getattr(err, name) == value
 
 
-def test_empty_file(tmp_path: Path) -> None:
+def test_empty_file(quiz_dir: Path) -> None:
     """Test error when file is empty."""
-    quiz_file = tmp_path / "empty.md"
-    quiz_file.write_text("", encoding="utf-8")
+    quiz_file = quiz_dir / "empty.md"
+    quiz_file.write_bytes(b"")
 
     with pytest.raises(QuizParseError, match="No questions found"):
         parse_quiz_file(quiz_file)
 
 
+def test_parse_quiz_text_matches_file(parsed_sample: list[Question]) -> None:
+    """Test that parsing text in memory gives the same questions as parsing the file."""
+    assert parse_quiz_text(_SAMPLE_CONTENT) == parsed_sample
+    assert parse_quiz_text(_SAMPLE_CONTENT.replace("\n", "\r\n")) == parsed_sample
+
+
+def test_parse_quiz_file_from_stream(parsed_sample: list[Question]) -> None:
+    """Test that an open text stream is parsed without touching the filesystem."""
+    assert parse_quiz_file(StringIO(_SAMPLE_CONTENT)) == parsed_sample
+
+
+def test_parse_quiz_file_from_str_path(temp_quiz_file: Path, parsed_sample: list[Question]) -> None:
+    """Test that a path given as a string is read as a file, not as a stream."""
+    assert parse_quiz_file(str(temp_quiz_file)) == parsed_sample
+
+
 def test_file_not_found() -> None:
     """Test error when file doesn't exist."""
     with pytest.raises(FileNotFoundError):
         parse_quiz_file(Path("/nonexistent/file.md"))
 
 
-def test_mixed_answer_types(tmp_path: Path) -> None:
-    """Test error when mixing single and multiple choice formats."""
-    content = """Question?
-
-- (X) Answer 1
-- [ ] Answer 2
-
-# reason
-Mixed types.
-"""
-    quiz_file = tmp_path / "mixed.md"
-    quiz_file.write_text(content, encoding="utf-8")
+def test_parsed_questions_are_immutable(parsed_sample: list[Question]) -> None:
+    """Test that parsed questions and answers cannot be modified."""
+    questions = parsed_sample
 
-    with pytest.raises(QuizParseError, match="Mixed answer types"):
-        parse_quiz_file(quiz_file)
+    with pytest.raises(FrozenInstanceError):
+        questions[0].text = "Changed"  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        questions[0].answers[0].is_correct = True  # type: ignore[misc]
 
 
-def test_lowercase_x_marker(tmp_path: Path) -> None:
+def test_lowercase_x_marker() -> None:
     """Test that lowercase 'x' is recognized as correct."""
     content = """Question?
 
@@ -152,88 +253,28 @@ def test_lowercase_x_marker(tmp_path: Path) -> None:
 # reason
 Testing lowercase.
 """
-    quiz_file = tmp_path / "lowercase.md"
-    quiz_file.write_text(content, encoding="utf-8")
 
-    questions = parse_quiz_file(quiz_file)
+    questions = parse_quiz_text(content)
     correct = [a for a in questions[0].answers if a.is_correct]
     assert len(correct) == 1
     assert correct[0].text == "Correct answer"
 
 
-def test_detailed_error_mixed_types(tmp_path: Path) -> None:
-    """Test detailed error reporting for mixed answer types."""
-    content = """What is the answer?
-
-- ( ) Wrong 1
-- (X) Correct
-- [ ] Wrong 2
-
-# reason
-This has mixed types.
-"""
-    quiz_file = tmp_path / "mixed_detailed.md"
-    quiz_file.write_text(content, encoding="utf-8")
-
-    with pytest.raises(QuizParseError) as exc_info:
-        parse_quiz_file(quiz_file)
-
-    # Check that detailed error info is attached
-    assert exc_info.value.parse_error is not None
-    err = exc_info.value.parse_error
-    assert isinstance(err, ParseError)
-    assert err.line_number == 5  # The line with [ ]
-    assert err.block_number == 1
-    assert "Mixed answer types" in err.error_message
-    assert len(err.context_before) > 0
-
-
-def test_detailed_error_no_correct_answer(tmp_path: Path) -> None:
-    """Test detailed error reporting when no correct answer is marked."""
-    content = """Which are colors?
-
-- [ ] Red
-- [ ] Blue
-- [ ] Green
-
-# reason
-All wrong!
-"""
-    quiz_file = tmp_path / "no_correct.md"
-    quiz_file.write_text(content, encoding="utf-8")
-
-    with pytest.raises(QuizParseError) as exc_info:
-        parse_quiz_file(quiz_file)
-
-    # Check detailed error info
-    assert exc_info.value.parse_error is not None
-    err = exc_info.value.parse_error
-    assert err.line_number == 3  # First answer line
-    assert "No correct answer marked" in err.error_message
-    assert "(X) or [X]" in err.error_message
-
-
-def test_detailed_error_no_answers(tmp_path: Path) -> None:
-    """Test detailed error reporting when question has no answers."""
-    content = """This is a question with no answers?
+def test_mismatched_marker_brackets() -> None:
+    """Test that a marker mixing ( and ] is not an answer but answer text."""
+    content = """Question?
 
-# reason
-No answer options provided.
+- (X) Correct answer
+- (X] Not a marker
+- ( ) Wrong answer
 """
-    quiz_file = tmp_path / "no_answers.md"
-    quiz_file.write_text(content, encoding="utf-8")
 
-    with pytest.raises(QuizParseError) as exc_info:
-        parse_quiz_file(quiz_file)
-
-    # Check detailed error info
-    assert exc_info.value.parse_error is not None
-    err = exc_info.value.parse_error
-    assert "No answers found" in err.error_message
-    assert "- (X)" in err.error_message or "- [X]" in err.error_message
+    questions = parse_quiz_text(content)
+    assert len(questions[0].answers) == 2
+    assert questions[0].answers[0].text == "Correct answer\n- (X] Not a marker"
 
 
-def test_error_context_lines(tmp_path: Path) -> None:
+def test_error_context_lines() -> None:
     """Test that error context includes surrounding lines."""
     content = """Line 1
 
@@ -249,11 +290,9 @@ Line 9
 # reason
 Test.
 """
-    quiz_file = tmp_path / "context.md"
-    quiz_file.write_text(content, encoding="utf-8")
 
     with pytest.raises(QuizParseError) as exc_info:
-        parse_quiz_file(quiz_file)
+        parse_quiz_text(content)
 
     err = exc_info.value.parse_error
     assert err is not None
@@ -266,7 +305,7 @@ Test.
     assert any("Answer 1" in line or "Correct" in line for line in err.context_before)
 
 
-def test_question_without_reason(tmp_path: Path) -> None:
+def test_question_without_reason() -> None:
     """Test that questions without reason are still valid (reason is optional)."""
     content = """What is the answer?
 
@@ -274,38 +313,14 @@ def test_question_without_reason(tmp_path: Path) -> None:
 - ( ) Wrong
 
 """
-    quiz_file = tmp_path / "no_reason.md"
-    quiz_file.write_text(content, encoding="utf-8")
 
     # Should parse successfully (reason is optional)
-    questions = parse_quiz_file(quiz_file)
+    questions = parse_quiz_text(content)
     assert len(questions) == 1
     assert questions[0].reason == ""  # Empty reason
 
 
-def test_error_no_question_text(tmp_path: Path) -> None:
-    """Test error when there's no question text."""
-    content = """
-- (X) Answer 1
-- ( ) Answer 2
-
-# reason
-Answers without a question.
-"""
-    quiz_file = tmp_path / "no_question.md"
-    quiz_file.write_text(content, encoding="utf-8")
-
-    with pytest.raises(QuizParseError) as exc_info:
-        parse_quiz_file(quiz_file)
-
-    # Check detailed error info
-    assert exc_info.value.parse_error is not None
-    err = exc_info.value.parse_error
-    assert "No question text found" in err.error_message
-    assert err.block_number == 1
-
-
-def test_codeblock_in_question(tmp_path: Path) -> None:
+def test_codeblock_in_question() -> None:
     """Test parsing question with embedded codeblock."""
     content = """What does this code do?
 
@@ -320,10 +335,8 @@ def hello():
 # reason
 The print function outputs to stdout.
 """
-    quiz_file = tmp_path / "codeblock_question.md"
-    quiz_file.write_text(content, encoding="utf-8")
 
-    questions = parse_quiz_file(quiz_file)
+    questions = parse_quiz_text(content)
     assert len(questions) == 1
 
     q = questions[0]
@@ -333,7 +346,7 @@ The print function outputs to stdout.
     assert len(q.answers) == 2
 
 
-def test_codeblock_in_answer(tmp_path: Path) -> None:
+def test_codeblock_in_answer() -> None:
     """Test parsing answer with codeblock (empty text after marker)."""
     content = """Which code is correct?
 
@@ -349,10 +362,8 @@ x = "1"
 # reason
 Strings use quotes.
 """
-    quiz_file = tmp_path / "codeblock_answer.md"
-    quiz_file.write_text(content, encoding="utf-8")
 
-    questions = parse_quiz_file(quiz_file)
+    questions = parse_quiz_text(content)
     assert len(questions) == 1
 
     q = questions[0]
@@ -368,7 +379,7 @@ Strings use quotes.
     assert 'x = "1"' in q.answers[1].text
 
 
-def test_codeblock_in_answer_with_text(tmp_path: Path) -> None:
+def test_codeblock_in_answer_with_text() -> None:
     """Test parsing answer with both text and codeblock."""
     content = """Which statement adds a policy?
 
@@ -384,10 +395,8 @@ def test_codeblock_in_answer_with_text(tmp_path: Path) -> None:
 # reason
 Allow is the correct effect.
 """
-    quiz_file = tmp_path / "codeblock_answer_text.md"
-    quiz_file.write_text(content, encoding="utf-8")
 
-    questions = parse_quiz_file(quiz_file)
+    questions = parse_quiz_text(content)
     assert len(questions) == 1
 
     q = questions[0]
@@ -404,7 +413,7 @@ Allow is the correct effect.
     assert '"Allow"' in q.answers[1].text
 
 
-def test_codeblock_in_reason(tmp_path: Path) -> None:
+def test_codeblock_in_reason() -> None:
     """Test parsing reason with codeblock."""
     content = """What is correct?
 
@@ -421,10 +430,8 @@ def example():
 
 This is a standard pattern.
 """
-    quiz_file = tmp_path / "codeblock_reason.md"
-    quiz_file.write_text(content, encoding="utf-8")
 
-    questions = parse_quiz_file(quiz_file)
+    questions = parse_quiz_text(content)
     assert len(questions) == 1
 
     q = questions[0]
@@ -433,7 +440,7 @@ This is a standard pattern.
     assert "standard pattern" in q.reason
 
 
-def test_multiline_question_preserved(tmp_path: Path) -> None:
+def test_multiline_question_preserved() -> None:
     """Test that newlines in question text are preserved for markdown."""
     content = """First paragraph of the question.
 
@@ -451,10 +458,8 @@ Final question line?
 # reason
 Test.
 """
-    quiz_file = tmp_path / "multiline_question.md"
-    quiz_file.write_text(content, encoding="utf-8")
 
-    questions = parse_quiz_file(quiz_file)
+    questions = parse_quiz_text(content)
     q = questions[0]
 
     # Check newlines are preserved (not joined with spaces)
@@ -462,3 +467,84 @@ Test.
     assert "First paragraph" in q.text
     assert "Second paragraph" in q.text
     assert "```json" in q.text
+
+
+def test_error_line_number_in_later_block() -> None:
+    """Test that error line numbers are absolute for blocks after a separator."""
+    content = """First question?
+
+- (X) Yes
+- ( ) No
+
+---
+
+Second question?
+
+- ( ) Yes
+- [X] No
+"""
+
+    with pytest.raises(QuizParseError) as exc_info:
+        parse_quiz_text(content)
+
+    assert exc_info.value.parse_error is not None
+    err = exc_info.value.parse_error
+    assert err.line_number == 11
+    assert err.line_content == "- [X] No"
+    assert err.block_number == 2
+
+
+def test_separator_only_on_own_line() -> None:
+    """Test that '---' inside a line (e.g. a markdown table) does not split questions."""
+    content = """Which row is the header?
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+- (X) The first
+- ( ) The last
+"""
+
+    questions = parse_quiz_text(content)
+    assert len(questions) == 1
+    assert "|---|---|" in questions[0].text
+
+
+def test_windows_line_endings(quiz_dir: Path) -> None:
+    """Test that CRLF line endings leave no stray carriage returns."""
+    content = "Question?\r\n\r\n- (X) Yes\r\n- ( ) No\r\n\r\n# reason\r\nBecause.\r\n"
+    quiz_file = quiz_dir / "crlf.md"
+    quiz_file.write_bytes(content.encode("utf-8"))
+
+    questions = parse_quiz_file(quiz_file)
+    assert questions[0].text == "Question?"
+    assert [a.text for a in questions[0].answers] == ["Yes", "No"]
+    assert questions[0].reason == "Because."
+
+
+def test_parse_quiz_file_cached(quiz_dir: Path) -> None:
+    """Test that an unchanged file is parsed once and a changed file again."""
+    quiz_file = quiz_dir / "cached.md"
+    quiz_file.write_bytes(_SAMPLE_BYTES)
+
+    first = parse_quiz_file(quiz_file)
+    second = parse_quiz_file(quiz_file)
+    assert second is not first
+    assert second[0].answers[0] is first[0].answers[0]
+
+    quiz_file.write_bytes(_SAMPLE_BYTES.replace(b"5000GB", b"5 TB"))
+    third = parse_quiz_file(quiz_file)
+    assert third[0].reason.endswith("5 TB.")
+
+
+def test_cached_answers_not_shared_mutably(quiz_dir: Path) -> None:
+    """Test that changing the answers of parsed questions leaves the cache untouched."""
+    quiz_file = quiz_dir / "shuffled.md"
+    quiz_file.write_bytes(_SAMPLE_BYTES)
+
+    answers = parse_quiz_file(quiz_file)[0].answers
+    answers.reverse()
+    answers.append(answers[0])
+
+    assert [a.text for a in parse_quiz_file(quiz_file)[0].answers] == ["1000", "5000", "10000"]